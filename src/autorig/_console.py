@@ -0,0 +1,8 @@
+"""Shared Rich console used for all AutoRig output."""
+
+import os
+
+from rich.console import Console
+
+# Repr highlighting is mostly colour, which NO_COLOR strips again anyway
+console = Console(highlight="NO_COLOR" not in os.environ)
@@ -6,12 +6,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
-from rich.console import Console
-
+from ._console import console
 from .config import RigConfig
 
-console = Console()
-
 
 class BackupManager:
     def __init__(self, config: RigConfig, backup_dir: str = "~/.autorig/backups"):
@@ -1,9 +1,9 @@
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
+from ._console import console
 from .cli_utils import (
     CommandTimer,
     ErrorHandler,
@@ -24,8 +24,6 @@ app = typer.Typer(
     add_completion=True,
 )
 
-console = Console()
-
 
 @app.command(hidden=True)
 def completion(
@@ -167,6 +165,13 @@ def apply(
     profile: str = typer.Option(
         None, "--profile", "-p", help="Use a specific profile configuration"
     ),
+    jobs: int = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Maximum number of dotfiles to link in parallel",
+    ),
 ):
     """
     Apply a rig configuration to the local machine.
@@ -208,6 +213,7 @@ def apply(
                 verbose=verbose,
                 force=force,
                 profile=profile,
+                jobs=jobs,
             )
             asyncio.run(rig.apply())
 
@@ -895,8 +901,6 @@ def remote(
     """
     local_path = None
     try:
-        import os
-
         from .remote import RemoteConfigManager
 
         console.print(f"[blue]Fetching remote configuration:[/blue] {url}")
@@ -979,14 +983,6 @@ def remote(
             console.print(f"[red]Unsupported command: {command}[/red]")
             raise typer.Exit(code=1)
 
-        # Clean up temporary file after successful operation
-        try:
-            if local_path and os.path.exists(local_path):
-                os.remove(local_path)
-                console.print("[green]Cleaned up temporary configuration file[/green]")
-        except OSError:
-            pass  # Don't fail if cleanup fails
-
     except Exception as e:
         console.print(ErrorHandler.format_error(e, verbose))
         raise typer.Exit(code=1)
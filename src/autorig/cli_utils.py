@@ -10,7 +10,6 @@ from typing import Any, Dict, List, Optional
 
 import typer
 from rich import box
-from rich.console import Console
 from rich.panel import Panel
 from rich.progress import (
     BarColumn,
@@ -26,7 +25,7 @@ from rich.progress import (
 from rich.rule import Rule
 from rich.table import Table
 
-console = Console()
+from ._console import console
 
 
 class EnhancedProgressTracker:
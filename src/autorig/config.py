@@ -1,5 +1,7 @@
 import os
 import re
+from functools import cached_property
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, field_validator, model_validator
@@ -9,13 +11,21 @@ from .profiles import load_profile_config
 try:
     import jsonschema  # type: ignore[import-untyped]
 
-    from .schema import get_config_schema
+    from .schema import get_config_validator
 
     SCHEMA_AVAILABLE = True
 except ImportError:
     SCHEMA_AVAILABLE = False
 
 
+_PATH_SEPARATORS = re.compile(r"[\\/]")
+
+
+def _has_parent_reference(path: str) -> bool:
+    """Return True if any component of path (``/`` or ``\\`` separated) is ``..``."""
+    return ".." in _PATH_SEPARATORS.split(path)
+
+
 class SystemConfig(BaseModel):
     packages: List[str] = []
 
@@ -36,6 +46,8 @@ class GitRepo(BaseModel):
     url: str
     path: str
     branch: Optional[str] = "main"
+    # Commits of history to clone; 0 or None clones the full history
+    depth: Optional[int] = 1
 
     @field_validator("url")
     @classmethod
@@ -49,7 +61,7 @@ class GitRepo(BaseModel):
     @classmethod
     def validate_path(cls, v):
         # Validate path does not contain dangerous patterns
-        if "../" in v or "..\\" in v:
+        if _has_parent_reference(v):
             raise ValueError(f"Path traversal detected in repository path: {v}")
         # Additional validation: path should be expandable
         expanded_path = os.path.expanduser(v)
@@ -57,6 +69,18 @@ class GitRepo(BaseModel):
             raise ValueError(f"Invalid repository path: {v}")
         return v
 
+    @cached_property
+    def expanded_path(self) -> Path:
+        """The repository path with ``~`` expanded, computed once."""
+        return Path(os.path.expanduser(self.path))
+
+    @field_validator("depth")
+    @classmethod
+    def validate_depth(cls, v):
+        if v is not None and v < 0:
+            raise ValueError(f"depth must not be negative: {v}")
+        return v
+
 
 class GitConfig(BaseModel):
     repositories: List[GitRepo] = []
@@ -77,7 +101,7 @@ class Dotfile(BaseModel):
     @classmethod
     def validate_path(cls, v):
         # Validate path does not contain dangerous patterns
-        if "../" in v or "..\\" in v:
+        if _has_parent_reference(v):
             raise ValueError(f"Path traversal detected in dotfile path: {v}")
 
         # Additional validation for dangerous paths
@@ -111,6 +135,8 @@ class Script(BaseModel):
     description: Optional[str] = None
     cwd: Optional[str] = None
     when: Optional[str] = "post"  # Options: 'pre', 'post', 'both'
+    # Run concurrently with adjacent scripts that are also marked parallel
+    parallel: bool = False
 
     @field_validator("command")
     @classmethod
@@ -125,7 +151,7 @@ class Script(BaseModel):
     def validate_cwd(cls, v):
         if v is not None:
             if v not in ["pre", "post", "both"]:
-                if "../" in v or "..\\" in v:
+                if _has_parent_reference(v):
                     raise ValueError(f"Path traversal detected in script field: {v}")
         return v
 
@@ -186,8 +212,12 @@ class RigConfig(BaseModel):
         # Perform schema validation if available
         if SCHEMA_AVAILABLE:
             try:
-                schema = get_config_schema()
-                jsonschema.validate(data, schema)
+                # Same error selection as jsonschema.validate
+                error = jsonschema.exceptions.best_match(
+                    get_config_validator().iter_errors(data)
+                )
+                if error is not None:
+                    raise error
             except jsonschema.ValidationError as e:
                 raise ValueError(f"Configuration schema validation failed: {e.message}")
             except Exception as e:
@@ -4,8 +4,7 @@ import os
 from pathlib import Path
 from typing import List, Optional
 
-from rich.console import Console
-
+from ._console import console
 from .backup import BackupManager
 from .config import RigConfig
 from .installers.base import get_system_installer
@@ -19,8 +18,6 @@ from .services.package_service import PackageService
 from .state import OperationTracker, StateManager
 from .templating import TemplateRenderer
 
-console = Console()
-
 
 class AutoRig:
     def __init__(
@@ -30,6 +27,7 @@ class AutoRig:
         verbose: bool = False,
         force: bool = False,
         profile: Optional[str] = None,
+        jobs: Optional[int] = None,
     ):
         self.config_path = config_path
         try:
@@ -72,6 +70,8 @@ class AutoRig:
             self.progress_tracker,
             self.dry_run,
             self.force,
+            self.verbose,
+            jobs,
         )
         self.hook_service = HookService(
             self.logger, self.progress_tracker, self.dry_run, self.verbose
@@ -114,7 +114,9 @@ class AutoRig:
         self.progress_tracker.start_operation("Configuration Apply", total_steps)
 
         # Create operation tracker for error recovery
-        tracker = OperationTracker(self.state_manager, "apply")
+        tracker = OperationTracker(
+            self.state_manager, "apply", timestamp_mode="per_batch"
+        )
 
         # Create a progress display
         with console.status(
@@ -179,7 +181,7 @@ class AutoRig:
 
                 self.logger.debug("Starting script execution")
                 status.update("[bold blue]Running custom scripts...[/bold blue]")
-                self.hook_service.run_scripts(self.config.scripts, tracker)
+                await self.hook_service.run_scripts_async(self.config.scripts, tracker)
                 self.progress_tracker.update_progress("Custom scripts executed")
 
                 # Execute post-script hooks
@@ -4,14 +4,12 @@ import json
 from pathlib import Path
 from typing import Dict, List
 
-from rich.console import Console
 from rich.table import Table
 from rich.tree import Tree
 
+from ._console import console
 from .config import RigConfig
 
-console = Console()
-
 
 class DependencyAnalyzer:
     """Analyzes and visualizes dependencies in AutoRig configurations."""
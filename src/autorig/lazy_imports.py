@@ -19,10 +19,18 @@ class LazyLoader:
         return self._module
 
     def __getattr__(self, name: str) -> Any:
-        """Forward attribute access to the loaded module."""
-        if self._module is None:
-            self()
-        return getattr(self._module, name)
+        """Forward attribute access to the loaded module.
+
+        Resolved attributes are stored on the instance so later lookups are
+        plain instance-dict hits and never reach ``__getattr__`` again.
+        """
+        if name in ("_module", "_module_name"):
+            # Not yet set (e.g. during copy/unpickle); avoid infinite recursion
+            raise AttributeError(name)
+        module = self._module if self._module is not None else self()
+        attr = getattr(module, name)
+        self.__dict__[name] = attr
+        return attr
 
 
 class LazyDict(dict):
@@ -38,11 +46,10 @@ class LazyDict(dict):
 
     def __getitem__(self, key: str) -> Any:
         """Get item with lazy loading."""
-        if key in self._loaders:
-            if key not in self:
-                self[key] = self._loaders[key]()
-            del self._loaders[key]
-        return super().__getitem__(key)
+        loader = self._loaders.pop(key, None)
+        if loader is not None and not dict.__contains__(self, key):
+            dict.__setitem__(self, key, loader())
+        return dict.__getitem__(self, key)
 
 
 def lazy_import(module_path: str) -> Callable[[], Any]:
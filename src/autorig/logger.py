@@ -3,35 +3,41 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+_LOG_DIR = Path(os.path.expanduser("~/.autorig/logs"))
 
-def setup_logging(verbose: bool = False):
-    log_dir = Path(os.path.expanduser("~/.autorig/logs"))
-    log_dir.mkdir(parents=True, exist_ok=True)
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+)
+_CONSOLE_FORMATTER = logging.Formatter("%(levelname)s - %(message)s")
 
-    # Create a log file with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = log_dir / f"autorig_{timestamp}.log"
 
+def setup_logging(verbose: bool = False):
     logger = logging.getLogger("autorig")
     logger.setLevel(logging.DEBUG)
 
+    # Reuse the file handler from a previous call so repeated setup does not
+    # create a new log file (and directory check) every time
+    fh = next((h for h in logger.handlers if isinstance(h, logging.FileHandler)), None)
+    if fh is None:
+        _LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Create a log file with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_file = _LOG_DIR / f"autorig_{timestamp}.log"
+
+        # File handler with detailed formatting
+        fh = logging.FileHandler(log_file)
+        fh.setLevel(logging.DEBUG)
+        fh.setFormatter(_FILE_FORMATTER)
+
     # Clear existing handlers to avoid duplicates
     logger.handlers.clear()
 
-    # File handler with detailed formatting
-    fh = logging.FileHandler(log_file)
-    fh.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
-    )
-    fh.setFormatter(file_formatter)
-
     # Console handler for verbose mode
     if verbose:
         ch = logging.StreamHandler()
         ch.setLevel(logging.INFO)
-        console_formatter = logging.Formatter("%(levelname)s - %(message)s")
-        ch.setFormatter(console_formatter)
+        ch.setFormatter(_CONSOLE_FORMATTER)
         logger.addHandler(ch)
 
     logger.addHandler(fh)
@@ -1,15 +1,90 @@
 """Multi-user support for shared AutoRig configurations."""
 
+import copy
+import io
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
-from rich.console import Console
 
+from ._console import console
 from .config import RigConfig
 
-console = Console()
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+# Last parse of each file as (st_mtime_ns, result); a changed mtime replaces
+# the entry, so there is one entry per config path. Cached objects are shared
+# between callers and must be treated as read-only.
+_CONFIG_CACHE: Dict[str, Tuple[int, RigConfig]] = {}
+_OVERRIDES_CACHE: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_cached_config(path: str) -> RigConfig:
+    """Load a RigConfig, reusing the previous result if the file is unchanged."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _CONFIG_CACHE.pop(path, None)
+        return RigConfig.from_yaml(path)  # raises a descriptive error
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        cached = _CONFIG_CACHE[path] = (mtime_ns, RigConfig.from_yaml(path))
+    return cached[1]
+
+
+def _load_cached_overrides(path: Path) -> Dict[str, Any]:
+    """Load a user overrides file, reusing the previous result if unchanged."""
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _OVERRIDES_CACHE.get(key)
+    if cached is None or cached[0] != mtime_ns:
+        with open(path, "r") as f:
+            overrides = yaml.load(f, Loader=_Loader) or {}
+        cached = _OVERRIDES_CACHE[key] = (mtime_ns, overrides)
+    return cached[1]
+
+
+def _list_yaml_files(directory: Path) -> Dict[str, Path]:
+    """Map the stem of every ``*.yaml`` file in a directory to its path."""
+    found: Dict[str, Path] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".yaml") and entry.is_file(follow_symlinks=False):
+                    found[name[:-5]] = Path(entry.path)
+    except FileNotFoundError:
+        pass
+    return found
+
+
+def _write_yaml_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Serialize data in memory, then write, fsync and rename it into place."""
+    buf = io.BytesIO()
+    yaml.dump(
+        data,
+        buf,
+        Dumper=_Dumper,
+        default_flow_style=False,
+        indent=2,
+        encoding="utf-8",
+    )
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb", buffering=0) as f:
+        f.write(buf.getvalue())
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 class MultiUserManager:
@@ -18,20 +93,27 @@ class MultiUserManager:
     def __init__(self, base_config_path: str):
         self.base_config_path = Path(base_config_path)
         self.shared_config_dir = self.base_config_path.parent / ".autorig" / "shared"
-        self.user_config_dir = Path.home() / ".autorig" / "configs"
+        self._home = Path.home()
+        self.user_config_dir = self._home / ".autorig" / "configs"
+        self._username = (
+            os.environ.get("USER") or os.environ.get("USERNAME") or "default"
+        )
+        self._default_user_path = self.user_config_dir / f"{self._username}.yaml"
+        self._lock_fds: Dict[str, int] = {}
 
         # Ensure directories exist
         self.shared_config_dir.mkdir(parents=True, exist_ok=True)
         self.user_config_dir.mkdir(parents=True, exist_ok=True)
 
     def get_current_username(self) -> str:
-        """Get the current username."""
-        return os.environ.get("USER", os.environ.get("USERNAME", "default"))
+        """Get the current username (resolved once at construction)."""
+        return self._username
 
     def get_user_config_path(self, username: Optional[str] = None) -> Path:
         """Get the config path for a specific user."""
-        user = username or self.get_current_username()
-        return self.user_config_dir / f"{user}.yaml"
+        if not username or username == self._username:
+            return self._default_user_path
+        return self.user_config_dir / f"{username}.yaml"
 
     def create_user_config(
         self, base_config: str, username: Optional[str] = None
@@ -41,17 +123,16 @@ class MultiUserManager:
         user_config_path = self.get_user_config_path(user)
 
         # Load base configuration
-        base_config_data = RigConfig.from_yaml(base_config)
+        base_config_data = _load_cached_config(base_config)
 
         # Create user-specific overrides
         user_overrides = {
             "name": f"{base_config_data.name} ({user})",
-            "variables": {"username": user, "user_home": str(Path.home())},
+            "variables": {"username": user, "user_home": str(self._home)},
         }
 
         # Save user config
-        with open(user_config_path, "w") as f:
-            yaml.dump(user_overrides, f, default_flow_style=False, indent=2)
+        _write_yaml_atomic(user_config_path, user_overrides)
 
         console.print(f"[green]✅ User configuration created for: {user}[/green]")
         console.print(f"[dim]Location: {user_config_path}[/dim]")
@@ -64,14 +145,7 @@ class MultiUserManager:
 
     def list_user_configs(self) -> Dict[str, Path]:
         """List all user-specific configurations."""
-        user_configs = {}
-
-        if self.user_config_dir.exists():
-            for config_file in self.user_config_dir.glob("*.yaml"):
-                username = config_file.stem
-                user_configs[username] = config_file
-
-        return user_configs
+        return _list_yaml_files(self.user_config_dir)
 
     def get_shared_config(self, config_name: str) -> Optional[Dict[str, Any]]:
         """Get a shared configuration by name."""
@@ -81,62 +155,57 @@ class MultiUserManager:
             return None
 
         with open(shared_config_path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_Loader)
 
     def save_shared_config(self, config_name: str, config_data: Dict[str, Any]) -> None:
         """Save a configuration to the shared directory."""
         shared_config_path = self.shared_config_dir / f"{config_name}.yaml"
 
-        with open(shared_config_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
+        _write_yaml_atomic(shared_config_path, config_data)
 
         console.print(f"[green]✅ Shared configuration saved: {config_name}[/green]")
         console.print(f"[dim]Location: {shared_config_path}[/dim]")
 
     def list_shared_configs(self) -> Dict[str, Path]:
         """List all shared configurations."""
-        shared_configs = {}
-
-        if self.shared_config_dir.exists():
-            for config_file in self.shared_config_dir.glob("*.yaml"):
-                config_name = config_file.stem
-                shared_configs[config_name] = config_file
-
-        return shared_configs
+        return _list_yaml_files(self.shared_config_dir)
 
     def _merge_configs(
         self, base: Dict[str, Any], override: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Deep merge two configuration dictionaries."""
-        result = base.copy()
-
-        for key, value in override.items():
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        result = copy.deepcopy(base)
+        stack = [(result, override)]
+
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    dst[key] = value
 
         return result
 
     def apply_config_for_user(
         self, base_config: str, username: Optional[str] = None
     ) -> RigConfig:
-        """Load and merge base configuration with user-specific overrides."""
+        """Load and merge base configuration with user-specific overrides.
+
+        Without overrides the cached base config itself is returned, so the
+        result is shared with other callers and must not be modified.
+        """
         user = username or self.get_current_username()
 
         # Load base configuration
-        base_config_data = RigConfig.from_yaml(base_config)
+        base_config_data = _load_cached_config(base_config)
 
         # Check for user-specific overrides
         user_config_path = self.get_user_config_path(user)
 
         if user_config_path.exists():
-            with open(user_config_path, "r") as f:
-                user_overrides = yaml.safe_load(f) or {}
+            user_overrides = _load_cached_overrides(user_config_path)
 
             # Merge configurations
             merged = self._merge_configs(base_config_data.model_dump(), user_overrides)
@@ -162,24 +231,45 @@ class MultiUserManager:
         return self.shared_config_dir / f"{config_name}.lock"
 
     def acquire_lock(self, config_name: str) -> bool:
-        """Acquire a lock for a configuration."""
+        """Acquire an advisory OS lock for a configuration.
+
+        The lock is held for as long as the file descriptor stays open, so it
+        is released automatically if the process exits without cleaning up.
+        """
+        if config_name in self._lock_fds:
+            return True
+
         lock_path = self.get_config_lock_path(config_name)
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o644)
 
-        if lock_path.exists():
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
             console.print(
                 f"[yellow]Configuration is locked by another user: {config_name}[/yellow]"
             )
             return False
 
-        lock_path.touch()
+        self._lock_fds[config_name] = fd
         return True
 
     def release_lock(self, config_name: str) -> None:
         """Release a lock for a configuration."""
-        lock_path = self.get_config_lock_path(config_name)
+        fd = self._lock_fds.pop(config_name, None)
+        if fd is None:
+            return
 
-        if lock_path.exists():
-            lock_path.unlink()
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
 
     def print_user_info(self) -> None:
         """Print information about current user and available configs."""
@@ -3,9 +3,29 @@ Notification system for AutoRig.
 Provides various notification mechanisms for long-running operations.
 """
 
+import functools
 import platform
+import shutil
 import subprocess
-from typing import Optional
+from typing import Any, Optional
+
+_toaster: Any = None
+
+
+def _get_toaster() -> Any:
+    """Return a shared win10toast ToastNotifier, creating it on first use."""
+    global _toaster
+    if _toaster is None:
+        from win10toast import ToastNotifier  # type: ignore[import-not-found]
+
+        _toaster = ToastNotifier()
+    return _toaster
+
+
+@functools.lru_cache(maxsize=None)
+def _terminal_notifier_path() -> Optional[str]:
+    """Locate terminal-notifier once per process."""
+    return shutil.which("terminal-notifier")
 
 
 class NotificationManager:
@@ -16,6 +36,13 @@ class NotificationManager:
     def __init__(self):
         self.system = platform.system().lower()
         self._available = self._check_notifications_available()
+        # The platform never changes, so resolve the sender once
+        self._sender = {
+            "darwin": self._send_macos_notification,
+            "linux": self._send_linux_notification,
+            "freebsd": self._send_linux_notification,
+            "windows": self._send_windows_notification,
+        }.get(self.system)
 
     def _check_notifications_available(self) -> bool:
         """
@@ -68,16 +95,11 @@ class NotificationManager:
         """
         Send a notification with the given title and message.
         """
-        if not self._available:
+        if self._sender is None or not self._available:
             return
 
         try:
-            if self.system == "darwin":  # macOS
-                self._send_macos_notification(title, message, duration, icon)
-            elif self.system in ["linux", "freebsd"]:  # Linux
-                self._send_linux_notification(title, message, duration, icon)
-            elif self.system == "windows":  # Windows
-                self._send_windows_notification(title, message, duration, icon)
+            self._sender(title, message, duration, icon)
         except Exception:
             # Don't let notification errors affect the main functionality
             pass
@@ -88,10 +110,11 @@ class NotificationManager:
         """
         Send notification on macOS using osascript or terminal-notifier.
         """
-        try:
-            # Try terminal-notifier first (more features)
+        terminal_notifier = _terminal_notifier_path()
+        if terminal_notifier:
+            # Prefer terminal-notifier (more features)
             cmd = [
-                "terminal-notifier",
+                terminal_notifier,
                 "-title",
                 title,
                 "-message",
@@ -103,7 +126,7 @@ class NotificationManager:
                 cmd.extend(["-appIcon", icon])
 
             subprocess.run(cmd, check=False)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             # Fallback to osascript
             script = f'display notification "{message}" with title "{title}"'
             subprocess.run(["osascript", "-e", script], check=False)
@@ -133,13 +156,7 @@ class NotificationManager:
         Send notification on Windows using win10toast.
         """
         try:
-            import importlib
-
-            win10toast_module = importlib.import_module("win10toast")
-            ToastNotifier = getattr(win10toast_module, "ToastNotifier")
-
-            toaster = ToastNotifier()
-            toaster.show_toast(
+            _get_toaster().show_toast(
                 title=title,
                 msg=message,
                 duration=duration,
@@ -178,11 +195,11 @@ class ProgressTracker:
             duration=3,
         )
 
-    def update_progress(self, step_description: str = ""):
+    def update_progress(self, step_description: str = "", steps: int = 1):
         """
-        Update progress to the next step.
+        Update progress by the given number of steps (one by default).
         """
-        self.current_step += 1
+        self.current_step += steps
         progress_percent = int((self.current_step / self.total_steps) * 100)
 
         message = f"{self.operation_name}: {self.current_step}/{self.total_steps} ({progress_percent}%)"
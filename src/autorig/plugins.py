@@ -1,21 +1,57 @@
 import abc
+import functools
 import importlib
 import importlib.metadata
-from typing import List
+import itertools
+import logging
+import sys
+from typing import Any, ClassVar, Dict, List, Set, Tuple
 
 from .config import RigConfig
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_points_by_group() -> Dict[str, Tuple[Any, ...]]:
+    """Scan installed entry points once per process and bucket them by group."""
+    entry_points = importlib.metadata.entry_points()
+    if type(entry_points) is dict:
+        # Python 3.9 returns a plain group -> entry points mapping
+        entry_points = itertools.chain.from_iterable(entry_points.values())
+    elif isinstance(entry_points, dict):
+        # Python 3.10/3.11 SelectableGroups: its dict interface is deprecated
+        groups = entry_points
+        entry_points = itertools.chain.from_iterable(
+            groups.select(group=group) for group in groups.groups
+        )
+    by_group: Dict[str, List[Any]] = {}
+    for entry_point in entry_points:
+        by_group.setdefault(entry_point.group, []).append(entry_point)
+    return {group: tuple(eps) for group, eps in by_group.items()}
+
+
+_loaded_entry_points: Dict[Tuple[str, str, str], Any] = {}
+
+
+def _load_entry_point(entry_point: Any) -> Any:
+    """Load an entry point, reusing the object loaded by a previous call."""
+    key = (entry_point.group, entry_point.name, entry_point.value)
+    loaded = _loaded_entry_points.get(key)
+    if loaded is None:
+        loaded = _loaded_entry_points[key] = entry_point.load()
+    return loaded
+
 
 class Plugin(abc.ABC):
     """
     Abstract base class for AutoRig plugins.
+
+    Subclasses set ``name`` as a class attribute.
     """
 
-    @property
-    @abc.abstractmethod
-    def name(self) -> str:
-        """The name of the plugin."""
-        pass
+    # The name of the plugin
+    name: ClassVar[str]
 
     @abc.abstractmethod
     def apply(
@@ -36,42 +72,37 @@ class PluginManager:
 
     def __init__(self) -> None:
         self.plugins: List[Plugin] = []
+        self._by_name: Dict[str, Plugin] = {}
 
     def register(self, plugin: Plugin) -> None:
         """Register a plugin."""
         self.plugins.append(plugin)
+        # The first plugin registered under a name keeps serving lookups
+        self._by_name.setdefault(plugin.name, plugin)
 
     def load_entry_points(self, group: str = "autorig.plugins") -> None:
         """Load plugins registered via entry points."""
-        try:
-            # Python 3.10+
-            entry_points = importlib.metadata.entry_points(group=group)
-        except TypeError:
-            # Fallback for older Python versions
-            entry_points = importlib.metadata.entry_points().get(group, [])  # type: ignore
-
-        for entry_point in entry_points:
+        for entry_point in _entry_points_by_group().get(group, ()):
             try:
-                plugin_class = entry_point.load()
-                if (
-                    isinstance(plugin_class, type)
-                    and issubclass(plugin_class, Plugin)
-                    and plugin_class != Plugin
-                ):
+                plugin_class = _load_entry_point(entry_point)
+                if _is_plugin_class(plugin_class):
                     self.register(plugin_class())
             except Exception as e:
-                print(f"Failed to load plugin {entry_point.name}: {e}")
+                logger.error("Failed to load plugin %s: %s", entry_point.name, e)
 
     def register_from_module(self, module_name: str) -> None:
         """Dynamically load and register plugins from a module."""
         try:
-            module = importlib.import_module(module_name)
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
+            module = sys.modules.get(module_name) or importlib.import_module(
+                module_name
+            )
+            for attr_name, attr in list(vars(module).items()):
+                if attr_name.startswith("_"):
+                    continue
                 if (
-                    isinstance(attr, type)
-                    and issubclass(attr, Plugin)
-                    and attr != Plugin
+                    _is_plugin_class(attr)
+                    # Skip plugin classes merely imported from elsewhere
+                    and attr.__module__ == module.__name__
                 ):
                     try:
                         plugin_instance = attr()
@@ -84,17 +115,16 @@ class PluginManager:
 
     def get_available_plugins(self) -> List[str]:
         """Return list of available plugin names."""
-        return [plugin.name for plugin in self.plugins]
+        return list(self._by_name)
 
     def run_plugin(
         self, name: str, config: RigConfig, dry_run: bool = False, verbose: bool = False
     ) -> bool:
         """Run a specific plugin by name."""
-        for plugin in self.plugins:
-            if plugin.name == name:
-                return plugin.apply(config, dry_run, verbose)
-
-        raise ValueError(f"Plugin '{name}' not found")
+        plugin = self._by_name.get(name)
+        if plugin is None:
+            raise ValueError(f"Plugin '{name}' not found")
+        return plugin.apply(config, dry_run, verbose)
 
     def run_all_plugins(
         self, config: RigConfig, dry_run: bool = False, verbose: bool = False
@@ -104,7 +134,7 @@ class PluginManager:
             try:
                 plugin.apply(config, dry_run, verbose)
             except Exception as e:
-                print(f"Plugin {plugin.name} failed: {e}")
+                logger.error("Plugin %s failed: %s", plugin.name, e)
 
 
 class DotfilePlugin(Plugin):
@@ -112,9 +142,7 @@ class DotfilePlugin(Plugin):
     Built-in plugin for managing dotfiles - a more advanced version of the core functionality.
     """
 
-    @property
-    def name(self) -> str:
-        return "dotfiles"
+    name = "dotfiles"
 
     def apply(
         self, config: RigConfig, dry_run: bool = False, verbose: bool = False
@@ -123,5 +151,21 @@ class DotfilePlugin(Plugin):
         return True
 
 
+# Classes already confirmed to be concrete Plugin subclasses
+_known_plugin_classes: Set[type] = set()
+
+
+def _is_plugin_class(obj: Any) -> bool:
+    """Return True if obj is a Plugin subclass other than Plugin itself."""
+    if not isinstance(obj, type):
+        return False
+    if obj in _known_plugin_classes:
+        return True
+    if issubclass(obj, Plugin) and obj is not Plugin:
+        _known_plugin_classes.add(obj)
+        return True
+    return False
+
+
 # Global plugin manager instance
 plugin_manager = PluginManager()
@@ -2,97 +2,124 @@
 Environment detection and profiles functionality for AutoRig.
 """
 
+import copy
+import functools
+import glob
+import hashlib
 import os
+import pickle
 import platform
+import re
 import socket
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import yaml  # type: ignore[import-untyped]
 
+from .utils import get_cache_dir
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# os.path.expandvars also understands %VAR% on Windows
+_ENV_VAR_MARKERS = ("$", "%") if os.name == "nt" else ("$",)
+
+# Parsed config files keyed by (path, st_mtime_ns, st_size)
+_yaml_cache: Dict[
+    Tuple[str, int, int], Tuple[Optional[Dict[str, str]], Dict[str, Any]]
+] = {}
+
+
+# Hostname hints for get_profile_name; laptop hints take priority
+_LAPTOP_NODE_RE = re.compile("laptop|thinkpad", re.IGNORECASE)
+_DESKTOP_NODE_RE = re.compile("desktop|tower", re.IGNORECASE)
+
+_DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+
+_VM_INDICATORS = ("vmware", "virtualbox", "qemu", "kvm", "parallels", "bochs")
+
+_PCI_GPU_VENDORS = {
+    "0x10de": "NVIDIA",
+    "0x1002": "AMD",
+    "0x8086": "Intel",
+    "0x1af4": "Red Hat (virtio)",
+    "0x15ad": "VMware",
+}
+
+# Distinguishes a missing profile key from one explicitly set to None
+_UNSET = object()
+
+
+class _LazyEnvironmentInfo(Mapping[str, Any]):
+    """
+    Read-only environment mapping whose expensive entries are computed on
+    first access and then kept.
+    """
+
+    def __init__(
+        self, values: Dict[str, Any], loaders: Dict[str, Callable[[], Any]]
+    ) -> None:
+        self._values = values
+        self._loaders = loaders
+        self._keys = tuple(values) + tuple(loaders)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            loader = self._loaders[key]
+        return self._values.setdefault(key, loader())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._loaders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
 
 class EnvironmentDetector:
     """
     Detects the current environment and system characteristics with caching.
     """
 
-    _cached_info: Optional[Dict[str, Any]] = None
-
     def __init__(self, use_cache: bool = True):
-        if use_cache and EnvironmentDetector._cached_info is not None:
-            self.env_info = EnvironmentDetector._cached_info
+        if use_cache:
+            self.env_info = _collect_environment_info()
         else:
-            self.env_info = self._collect_environment_info()
-            if use_cache:
-                EnvironmentDetector._cached_info = self.env_info
-
-    def _collect_environment_info(self) -> Dict[str, Any]:
-        """Collect information about the current environment."""
-        return {
-            "os": platform.system().lower(),
-            "platform": platform.platform(),
-            "machine": platform.machine(),
-            "node": socket.gethostname(),
-            "release": platform.release(),
-            "version": platform.version(),
-            "architecture": platform.architecture()[0],
-            "python_version": platform.python_version(),
-            "shell": os.environ.get("SHELL", ""),
-            "user": os.environ.get("USER", os.environ.get("USERNAME", "")),
-            "home": os.path.expanduser("~"),
-            "is_wsl": self._is_wsl(),
-            "is_docker": self._is_docker(),
-            "is_vm": self._is_vm(),
-            "is_ci": self._is_ci(),
-            "desktop_environment": os.environ.get("XDG_CURRENT_DESKTOP", ""),
-            "display_server": os.environ.get("XDG_SESSION_TYPE", ""),
-            "session_type": os.environ.get("XDG_SESSION_TYPE", ""),
-            "wayland_display": os.environ.get("WAYLAND_DISPLAY", ""),
-            "term": os.environ.get("TERM", ""),
-            "term_program": os.environ.get("TERM_PROGRAM", ""),
-            "editor": os.environ.get("EDITOR", os.environ.get("VISUAL", "vi")),
-            "language": os.environ.get("LANG", ""),
-            "timezone": os.environ.get("TZ", ""),
-            "display": os.environ.get("DISPLAY", ""),
-            "packages_installed": self._get_installed_packages(),
-            "gpu_info": self._get_gpu_info(),
-            "memory_gb": self._get_memory_gb(),
-            "cpu_cores": self._get_cpu_cores(),
-            "disk_space_gb": self._get_disk_space_gb(),
-        }
-
-    def _is_vm(self) -> bool:
+            # Fresh info for this detector only; the process-wide cache that
+            # other detectors and load_profile_config share is left alone
+            self.env_info = _collect_environment_info.__wrapped__()
+
+    @staticmethod
+    def _is_vm() -> bool:
         """Check if running inside a virtual machine."""
+        # Check for common VM indicators in DMI; this is a plain file read, so
+        # only spawn systemd-detect-virt when it finds nothing (Hyper-V, Xen
+        # and most cloud instances use product names not in the list)
         try:
-            # Check for common VM indicators in DMI
-            import subprocess
+            with open("/sys/class/dmi/id/product_name", "r") as f:
+                product_name = f.read().strip().lower()
+            if any(indicator in product_name for indicator in _VM_INDICATORS):
+                return True
+        except OSError:
+            pass
 
+        try:
             result = subprocess.run(
                 ["systemd-detect-virt"], capture_output=True, text=True, check=True
             )
-            if result.stdout.strip() != "none":
-                return True
+            return result.stdout.strip() != "none"
         except (subprocess.CalledProcessError, FileNotFoundError):
-            # Fallback method: check for VM indicators in other ways
-            try:
-                with open("/sys/class/dmi/id/product_name", "r") as f:
-                    product_name = f.read().strip().lower()
-                    vm_indicators = [
-                        "vmware",
-                        "virtualbox",
-                        "qemu",
-                        "kvm",
-                        "parallels",
-                        "bochs",
-                    ]
-                    if any(indicator in product_name for indicator in vm_indicators):
-                        return True
-            except FileNotFoundError:
-                pass
-        return False
+            return False
 
-    def _is_ci(self) -> bool:
+    @staticmethod
+    def _is_ci() -> bool:
         """Check if running in a CI/CD environment."""
         ci_vars = [
             "CI",
@@ -107,10 +134,17 @@ class EnvironmentDetector:
         ]
         return any(os.environ.get(var) for var in ci_vars)
 
-    def _get_installed_packages(self) -> List[str]:
+    @staticmethod
+    def _get_installed_packages(os_name: str) -> List[str]:
         """Get a list of installed packages (best effort)."""
         try:
-            if self.env_info["os"] == "linux":
+            if os_name == "linux":
+                # Read the dpkg database directly rather than forking dpkg -l
+                try:
+                    return _read_dpkg_status(_DPKG_STATUS_PATH)
+                except OSError:
+                    pass
+
                 # Try different package managers
                 for cmd in [
                     ["dpkg", "-l"],
@@ -132,7 +166,7 @@ class EnvironmentDetector:
                         return [pkg for pkg in packages if pkg]
                     except (subprocess.CalledProcessError, FileNotFoundError):
                         continue
-            elif self.env_info["os"] == "darwin":
+            elif os_name == "darwin":
                 try:
                     result = subprocess.run(
                         ["brew", "list"], capture_output=True, text=True, check=True
@@ -146,10 +180,15 @@ class EnvironmentDetector:
             pass
         return []
 
-    def _get_gpu_info(self) -> str:
+    @staticmethod
+    def _get_gpu_info(os_name: str) -> str:
         """Get GPU information."""
         try:
-            if self.env_info["os"] == "linux":
+            if os_name == "linux":
+                gpu = _read_drm_gpu_vendor()
+                if gpu:
+                    return gpu
+
                 result = subprocess.run(
                     ["lspci"], capture_output=True, text=True, check=True
                 )
@@ -160,7 +199,7 @@ class EnvironmentDetector:
                         or "display" in line.lower()
                     ):
                         return line.strip().split(":")[-1].strip()
-            elif self.env_info["os"] == "darwin":
+            elif os_name == "darwin":
                 result = subprocess.run(
                     ["system_profiler", "SPDisplaysDataType"],
                     capture_output=True,
@@ -174,10 +213,11 @@ class EnvironmentDetector:
             pass
         return "Unknown"
 
-    def _get_memory_gb(self) -> float:
+    @staticmethod
+    def _get_memory_gb(os_name: str) -> float:
         """Get total system memory in GB."""
         try:
-            if self.env_info["os"] == "linux":
+            if os_name == "linux":
                 with open("/proc/meminfo", "r") as f:
                     for line in f:
                         if line.startswith("MemTotal:"):
@@ -185,7 +225,7 @@ class EnvironmentDetector:
                             parts = line.split()
                             kb = int(parts[1])
                             return round(kb / 1024 / 1024, 2)  # Convert to GB
-            elif self.env_info["os"] == "darwin":
+            elif os_name == "darwin":
                 result = subprocess.run(
                     ["sysctl", "-n", "hw.memsize"],
                     capture_output=True,
@@ -198,7 +238,8 @@ class EnvironmentDetector:
             pass
         return 0.0
 
-    def _get_cpu_cores(self) -> int:
+    @staticmethod
+    def _get_cpu_cores() -> int:
         """Get number of CPU cores."""
         try:
             import multiprocessing
@@ -207,7 +248,8 @@ class EnvironmentDetector:
         except Exception:
             return 0
 
-    def _get_disk_space_gb(self) -> float:
+    @staticmethod
+    def _get_disk_space_gb() -> float:
         """Get available disk space in GB."""
         try:
             import shutil
@@ -217,24 +259,26 @@ class EnvironmentDetector:
         except Exception:
             return 0.0
 
-    def _is_wsl(self) -> bool:
+    @staticmethod
+    def _is_wsl() -> bool:
         """Check if running under Windows Subsystem for Linux."""
         try:
-            with open("/proc/version", "r") as f:
-                return "microsoft" in f.read().lower()
+            with open("/proc/version", "rb") as f:
+                return b"microsoft" in f.read().lower()
         except FileNotFoundError:
             return False
 
-    def _is_docker(self) -> bool:
+    @staticmethod
+    def _is_docker() -> bool:
         """Check if running inside a Docker container."""
         # Check for .dockerenv file
-        if Path("/.dockerenv").exists():
+        if os.path.exists("/.dockerenv"):
             return True
 
-        # Check for docker cgroup
+        # Check for docker cgroup; compare bytes to skip decoding the file
         try:
-            with open("/proc/1/cgroup", "r") as f:
-                return "docker" in f.read()
+            with open("/proc/1/cgroup", "rb") as f:
+                return b"docker" in f.read()
         except FileNotFoundError:
             return False
 
@@ -248,9 +292,9 @@ class EnvironmentDetector:
         profile_parts = [os_name, machine]
 
         # Add more specific identifiers if available
-        if "laptop" in node.lower() or "thinkpad" in node.lower():
+        if _LAPTOP_NODE_RE.search(node):
             profile_parts.append("laptop")
-        elif "desktop" in node.lower() or "tower" in node.lower():
+        elif _DESKTOP_NODE_RE.search(node):
             profile_parts.append("desktop")
         elif self.env_info.get("is_wsl"):
             profile_parts.append("wsl")
@@ -271,54 +315,174 @@ class EnvironmentDetector:
         - 'shell': match for shell
         - 'conditions': custom conditions
         """
-        if "os" in profile_spec and profile_spec["os"] != self.env_info["os"]:
+        # Checked inline: compiling a one-off predicate would cost more than
+        # it saves (see compile_profile for specs evaluated repeatedly)
+        env = self.env_info
+        get = profile_spec.get
+
+        # Cheapest and most selective checks first
+        if (value := get("os", _UNSET)) is not _UNSET and value != env["os"]:
             return False
 
-        if (
-            "platform" in profile_spec
-            and profile_spec["platform"] not in self.env_info["platform"]
-        ):
+        if (value := get("machine", _UNSET)) is not _UNSET and value != env["machine"]:
             return False
 
-        if (
-            "machine" in profile_spec
-            and profile_spec["machine"] != self.env_info["machine"]
-        ):
+        if (value := get("hostname", _UNSET)) is not _UNSET and value != env["node"]:
             return False
 
-        if (
-            "hostname" in profile_spec
-            and profile_spec["hostname"] != self.env_info["node"]
-        ):
+        if (value := get("shell", _UNSET)) is not _UNSET and value not in env["shell"]:
             return False
 
-        if (
-            "shell" in profile_spec
-            and profile_spec["shell"] not in self.env_info["shell"]
-        ):
+        value = get("platform", _UNSET)
+        if value is not _UNSET and value not in env["platform"]:
             return False
 
         # Check custom conditions
-        if "conditions" in profile_spec:
-            for condition in profile_spec["conditions"]:
-                if not self._evaluate_condition(condition):
+        conditions = get("conditions")
+        if conditions is not None:
+            for condition in conditions:
+                if not _evaluate_condition(env, condition):
                     return False
 
         return True
 
+    def matches_many(self, profile_specs: List[Dict[str, Any]]) -> List[bool]:
+        """Check several profile specifications against the environment."""
+        matches = self.matches_profile
+        return [matches(spec) for spec in profile_specs]
+
     def _evaluate_condition(self, condition: str) -> bool:
         """Evaluate a custom condition."""
-        # Simple condition evaluation
-        if condition == "is_wsl":
-            return self.env_info.get("is_wsl", False)
-        elif condition == "is_docker":
-            return self.env_info.get("is_docker", False)
-        elif condition.startswith("env:"):
-            # Check environment variable
-            env_var = condition[4:]  # Remove 'env:' prefix
-            key, expected = env_var.split("=", 1) if "=" in env_var else (env_var, "1")
-            return os.environ.get(key, "") == expected
-        return False
+        return _evaluate_condition(self.env_info, condition)
+
+
+def compile_profile(
+    profile_spec: Dict[str, Any],
+) -> Callable[[Mapping[str, Any]], bool]:
+    """
+    Turn a profile specification into a predicate over environment info.
+
+    The spec is inspected once, so a compiled profile can be kept and
+    evaluated cheaply against many environments. See
+    ``EnvironmentDetector.matches_profile`` for the supported keys.
+    """
+    checks: List[Callable[[Mapping[str, Any]], bool]] = []
+    get = profile_spec.get
+
+    # Cheapest and most selective checks first
+    if (value := get("os", _UNSET)) is not _UNSET:
+        checks.append(lambda env, v=value: env["os"] == v)
+    if (value := get("machine", _UNSET)) is not _UNSET:
+        checks.append(lambda env, v=value: env["machine"] == v)
+    if (value := get("hostname", _UNSET)) is not _UNSET:
+        checks.append(lambda env, v=value: env["node"] == v)
+    if (value := get("shell", _UNSET)) is not _UNSET:
+        checks.append(lambda env, v=value: v in env["shell"])
+    if (value := get("platform", _UNSET)) is not _UNSET:
+        checks.append(lambda env, v=value: v in env["platform"])
+
+    # Check custom conditions
+    for condition in get("conditions") or ():
+        checks.append(lambda env, c=condition: _evaluate_condition(env, c))
+
+    def matches(env: Mapping[str, Any]) -> bool:
+        for check in checks:
+            if not check(env):
+                return False
+        return True
+
+    return matches
+
+
+def _evaluate_condition(env: Mapping[str, Any], condition: str) -> bool:
+    """Evaluate a custom condition."""
+    # Simple condition evaluation
+    if condition == "is_wsl":
+        return env.get("is_wsl", False)
+    elif condition == "is_docker":
+        return env.get("is_docker", False)
+    elif condition.startswith("env:"):
+        # Check environment variable
+        env_var = condition[4:]  # Remove 'env:' prefix
+        key, expected = env_var.split("=", 1) if "=" in env_var else (env_var, "1")
+        return os.environ.get(key, "") == expected
+    return False
+
+
+def _read_dpkg_status(path: str) -> List[str]:
+    """Return the names of installed packages from a dpkg status file."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        stanzas = f.read().split("\n\n")
+
+    packages = []
+    for stanza in stanzas:
+        name = None
+        installed = False
+        for line in stanza.splitlines():
+            if line.startswith("Package: "):
+                name = line[9:].strip()
+            elif line.startswith("Status: "):
+                installed = line.endswith(" installed")
+        if name and installed:
+            packages.append(name)
+    return packages
+
+
+def _read_drm_gpu_vendor() -> Optional[str]:
+    """Identify the GPU vendor from sysfs DRM devices, if any are exposed."""
+    for vendor_file in sorted(glob.glob("/sys/class/drm/card*/device/vendor")):
+        try:
+            with open(vendor_file, "r") as f:
+                vendor_id = f.read().strip().lower()
+        except OSError:
+            continue
+        return _PCI_GPU_VENDORS.get(vendor_id, f"PCI vendor {vendor_id}")
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _collect_environment_info() -> Mapping[str, Any]:
+    """Collect information about the current environment once per process."""
+    os_name = platform.system().lower()
+    env_get = os.environ.get
+    values = {
+        "os": os_name,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "node": socket.gethostname(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "architecture": platform.architecture()[0],
+        "python_version": platform.python_version(),
+        "shell": env_get("SHELL", ""),
+        "user": env_get("USER", env_get("USERNAME", "")),
+        "home": os.path.expanduser("~"),
+        "is_wsl": EnvironmentDetector._is_wsl(),
+        "is_docker": EnvironmentDetector._is_docker(),
+        "is_ci": EnvironmentDetector._is_ci(),
+        "desktop_environment": env_get("XDG_CURRENT_DESKTOP", ""),
+        "display_server": env_get("XDG_SESSION_TYPE", ""),
+        "session_type": env_get("XDG_SESSION_TYPE", ""),
+        "wayland_display": env_get("WAYLAND_DISPLAY", ""),
+        "term": env_get("TERM", ""),
+        "term_program": env_get("TERM_PROGRAM", ""),
+        "editor": env_get("EDITOR", env_get("VISUAL", "vi")),
+        "language": env_get("LANG", ""),
+        "timezone": env_get("TZ", ""),
+        "display": env_get("DISPLAY", ""),
+        "cpu_cores": EnvironmentDetector._get_cpu_cores(),
+    }
+    # These spawn subprocesses or scan the system, so only run them on demand
+    loaders: Dict[str, Callable[[], Any]] = {
+        "is_vm": EnvironmentDetector._is_vm,
+        "packages_installed": lambda: EnvironmentDetector._get_installed_packages(
+            os_name
+        ),
+        "gpu_info": lambda: EnvironmentDetector._get_gpu_info(os_name),
+        "memory_gb": lambda: EnvironmentDetector._get_memory_gb(os_name),
+        "disk_space_gb": EnvironmentDetector._get_disk_space_gb,
+    }
+    return _LazyEnvironmentInfo(values, loaders)
 
 
 def load_profile_config(
@@ -341,59 +505,181 @@ def load_profile_config(
         profile = detector.get_profile_name()
 
     # List of config files to try, in order of precedence (last wins)
+    base_path = Path(config_path)
+    stem, suffix, parent = base_path.stem, base_path.suffix, base_path.parent
     config_files = [
-        config_path,  # Base config
-        config_path.replace(".yaml", f"-{profile}.yaml"),  # Profile-specific
-        config_path.replace(".yaml", ".local.yaml"),  # Local overrides
+        base_path,  # Base config
+        parent / f"{stem}-{profile}{suffix}",  # Profile-specific
+        parent / f"{stem}.local{suffix}",  # Local overrides
     ]
 
     final_config: Dict[str, Any] = {}
 
-    for config_file in config_files:
-        config_path_obj = Path(config_file)
-        if config_path_obj.exists():
-            with open(config_path_obj, "r") as f:
-                content = f.read()
+    for config_path_obj in config_files:
+        # A single stat both skips missing files and keys the parse cache
+        try:
+            stat = os.stat(config_path_obj)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        config_data = _load_config_file(config_path_obj, stat)
+
+        # Set the profile sections aside so the inactive ones are not
+        # walked by the deep merge below
+        profiles = config_data.get("profiles")
+        if isinstance(profiles, dict):
+            del config_data["profiles"]
+        else:
+            profiles = {}
+
+        # First merge the base configuration from this file
+        final_config = _deep_merge(final_config, config_data)
 
-            # Expand environment variables in the content
-            try:
-                content = os.path.expandvars(content)
-            except Exception as e:
-                raise ValueError(
-                    f"Error expanding environment variables in config: {e}"
-                )
+        if profiles:
+            # Keep every profile section around for schema validation
+            final_config["profiles"] = {
+                **final_config.get("profiles", {}),
+                **profiles,
+            }
 
-            try:
-                config_data = yaml.safe_load(content) or {}
-            except yaml.YAMLError as e:
-                raise ValueError(f"Invalid YAML in configuration file: {e}")
-
-            # First merge the base configuration from this file
-            final_config = _deep_merge(final_config, config_data)
-
-            # Then apply profile-specific sections if they exist
-            if (
-                profile
-                and "profiles" in config_data
-                and profile in config_data["profiles"]
-            ):
-                profile_config = config_data["profiles"][profile]
-                # Merge profile config with base config
-                final_config = _deep_merge(final_config, profile_config)
+        # Then apply profile-specific sections if they exist
+        if profile and profile in profiles:
+            # Merge profile config with base config
+            final_config = _deep_merge(final_config, profiles[profile])
 
     return final_config
 
 
-def _deep_merge(base: Dict, override: Dict) -> Dict:
+def _load_config_file(path: Path, stat: os.stat_result) -> Dict[str, Any]:
     """
-    Deep merge two dictionaries.
+    Return the parsed contents of a config file, reusing the previous parse
+    while the file (and, if it uses variables, the environment) is unchanged.
     """
-    result = base.copy()
-
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _yaml_cache.get(key)
+    if cached is None or (cached[0] is not None and cached[0] != os.environ):
+        sidecar_data = _read_sidecar(path, stat)
+        if sidecar_data is not None:
+            cached = (None, sidecar_data)
         else:
-            result[key] = value
+            cached = _read_config_file(path)
+            if cached[0] is None:
+                _write_sidecar(path, stat, cached[1])
+        _yaml_cache[key] = cached
+    # Callers are free to mutate the result, so never hand out the cached copy
+    return copy.deepcopy(cached[1])
+
+
+# Most sidecars kept in the cache; the oldest written are pruned beyond this
+SIDECAR_LIMIT = 256
+
+
+def _sidecar_path(path: Path) -> Path:
+    """Location of the pickled parse of a config file in the cache dir."""
+    digest = hashlib.sha256(str(path.absolute()).encode()).hexdigest()
+    return get_cache_dir() / "configs" / f"{digest}.pkl"
+
+
+def _read_sidecar(path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """
+    Load a config's pickled parse from a previous process, if it is still
+    valid for the file's current mtime and size.
+    """
+    try:
+        with open(_sidecar_path(path), "rb") as f:
+            mtime_ns, size, data = pickle.load(f)
+    except Exception:
+        # Missing, unreadable or stale-format sidecar: parse the YAML instead
+        return None
+    if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+        return None
+    return data
+
+
+def _write_sidecar(path: Path, stat: os.stat_result, data: Dict[str, Any]) -> None:
+    """
+    Persist a config's parse for later processes. Only used for files without
+    environment variables, whose parse does not depend on the environment.
+    """
+    try:
+        sidecar = _sidecar_path(path)
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        payload = pickle.dumps(
+            (stat.st_mtime_ns, stat.st_size, data), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        tmp_path = sidecar.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, sidecar)
+        _prune_sidecars(sidecar.parent)
+    except Exception:
+        pass  # The sidecar is only an optimization
+
+
+def _prune_sidecars(directory: Path) -> None:
+    """
+    Delete the oldest sidecars beyond SIDECAR_LIMIT, so parses of deleted or
+    temporary configs do not pile up. Only runs after a write, i.e. on a miss.
+    """
+    with os.scandir(directory) as entries:
+        sidecars = [
+            (entry.stat().st_mtime_ns, entry.path)
+            for entry in entries
+            if entry.name.endswith(".pkl")
+        ]
+    excess = len(sidecars) - SIDECAR_LIMIT
+    if excess > 0:
+        for _, stale in sorted(sidecars)[:excess]:
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
+
+
+def _read_config_file(path: Path) -> Tuple[Optional[Dict[str, str]], Dict[str, Any]]:
+    """
+    Parse a YAML config file, expanding environment variables first.
+
+    Returns the environment used for expansion (None if the file has no
+    variables) together with the parsed data.
+    """
+    with open(path, "r") as f:
+        content = f.read()
+
+    # Expand environment variables in the content; skip the extra pass over
+    # the text when there is nothing to expand
+    environ = None
+    if any(marker in content for marker in _ENV_VAR_MARKERS):
+        environ = dict(os.environ)
+        try:
+            content = os.path.expandvars(content)
+        except Exception as e:
+            raise ValueError(f"Error expanding environment variables in config: {e}")
+
+    try:
+        return environ, yaml.load(content, Loader=_SafeLoader) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid YAML in configuration file: {e}")
+
+
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    """
+    Deep merge two dictionaries without modifying either of them.
+
+    Only the dicts along paths touched by ``override`` are copied; untouched
+    nested values are shared with ``base``.
+    """
+    result = {**base}
+    stack = [(result, override)]
+
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            existing = dst.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                merged = {**existing}
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
 
     return result
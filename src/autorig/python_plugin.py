@@ -3,11 +3,114 @@ Example plugin for Python development environment setup.
 """
 
 import os
+import shutil
 import subprocess
+import sys
+import tempfile
 from pathlib import Path
+from typing import List
 
 from .config import RigConfig
 from .plugins import Plugin
+from .utils import get_cache_dir
+
+# Location of the interpreter inside a venv on this platform
+_VENV_BIN = "Scripts" if os.name == "nt" else "bin"
+_VENV_PYTHON = "python.exe" if os.name == "nt" else "python"
+
+
+def _template_venv() -> Path:
+    """
+    Return a pristine venv for the running interpreter, creating it once.
+
+    The template lives in the AutoRig cache and is cloned into projects, so
+    the slow part of ``python -m venv`` (bootstrapping pip) only runs once
+    per Python version.
+    """
+    version = f"{sys.implementation.name}{sys.version_info[0]}.{sys.version_info[1]}"
+    template = get_cache_dir() / "venv" / version
+    if not template.exists():
+        template.parent.mkdir(parents=True, exist_ok=True)
+        # Build next to the final location and rename, so a half-built
+        # template is never picked up
+        build_dir = Path(tempfile.mkdtemp(dir=template.parent, prefix=".build-"))
+        try:
+            build_venv = build_dir / "venv"
+            subprocess.run([sys.executable, "-m", "venv", str(build_venv)], check=True)
+            _relocate_scripts(build_venv, build_venv, template)
+            os.replace(build_venv, template)
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+    return template
+
+
+def _clone_venv(template: Path, venv_path: Path) -> None:
+    """Create a venv at venv_path by hardlinking the files of template."""
+    shutil.copytree(template, venv_path, symlinks=True, copy_function=_link_or_copy)
+    _relocate_scripts(venv_path, template, venv_path)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hardlink src to dst, copying instead across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _relocate_scripts(venv_path: Path, old: Path, new: Path) -> None:
+    """
+    Rewrite the venv's scripts that embed old (activate scripts, console
+    script shebangs) to refer to new.
+
+    Rewritten scripts are written as new files, so a hardlinked original is
+    never modified.
+    """
+    old_bytes, new_bytes = os.fsencode(str(old)), os.fsencode(str(new))
+    with os.scandir(venv_path / _VENV_BIN) as entries:
+        for entry in entries:
+            if entry.is_symlink() or not entry.is_file():
+                continue
+            with open(entry.path, "rb") as f:
+                content = f.read()
+            if old_bytes not in content:
+                continue
+            mode = entry.stat().st_mode
+            os.unlink(entry.path)
+            with open(entry.path, "wb") as f:
+                f.write(content.replace(old_bytes, new_bytes))
+            os.chmod(entry.path, mode)
+
+
+def _create_venv(venv_path: Path) -> None:
+    """Create a virtual environment, cloning the cached template if possible."""
+    if os.name == "nt":
+        # Windows launchers embed their interpreter path in the executable,
+        # so venvs cannot be cloned by rewriting text
+        subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
+        return
+    _clone_venv(_template_venv(), venv_path)
+
+
+def _pip_install_command(venv_python: str, packages: List[str]) -> List[str]:
+    """
+    Build a single command installing all packages into the venv.
+
+    uv is used when it is on PATH; otherwise the venv's pip, preferring
+    wheels (served from pip's shared cache on repeat runs) over sdists.
+    """
+    uv = shutil.which("uv")
+    if uv:
+        return [uv, "pip", "install", "--python", venv_python, *packages]
+    return [
+        venv_python,
+        "-m",
+        "pip",
+        "install",
+        "--prefer-binary",
+        "--no-input",
+        *packages,
+    ]
 
 
 class PythonDevPlugin(Plugin):
@@ -15,9 +118,7 @@ class PythonDevPlugin(Plugin):
     Plugin for setting up Python development environment.
     """
 
-    @property
-    def name(self) -> str:
-        return "python-dev"
+    name = "python-dev"
 
     def apply(
         self, config: RigConfig, dry_run: bool = False, verbose: bool = False
@@ -26,25 +127,21 @@ class PythonDevPlugin(Plugin):
             print("Applying Python development environment setup...")
 
         # Look for Python-specific configuration in the variables
-        python_version = config.variables.get("python_version", "3.9")
-        venv_name = config.variables.get("python_venv", ".venv")
+        variables = config.variables
+        python_version = variables.get("python_version", "3.9")
+        venv_name = variables.get("python_venv", ".venv")
 
         if dry_run:
             print(f"DRY RUN: Would setup Python {python_version} with venv {venv_name}")
             return True
 
         try:
-            # Create a virtual environment if it doesn't exist
-            if not hasattr(config, "python") or not config.variables.get(
-                "skip_venv", False
-            ):
-                current_dir = Path.cwd()
-                venv_path = current_dir / venv_name
+            venv_path = Path.cwd() / venv_name
 
+            # Create a virtual environment if it doesn't exist
+            if not hasattr(config, "python") or not variables.get("skip_venv", False):
                 if not venv_path.exists():
-                    subprocess.run(
-                        ["python3", "-m", "venv", str(venv_path)], check=True
-                    )
+                    _create_venv(venv_path)
                     if verbose:
                         print(f"Created virtual environment at {venv_path}")
                 else:
@@ -52,17 +149,16 @@ class PythonDevPlugin(Plugin):
                         print(f"Virtual environment already exists at {venv_path}")
 
             # Install packages if specified
-            python_packages = config.variables.get("python_packages", [])
+            python_packages = variables.get("python_packages", [])
             if python_packages:
-                venv_python = (
-                    str(Path(venv_name) / "bin" / "python")
-                    if os.name != "nt"
-                    else str(Path(venv_name) / "Scripts" / "python.exe")
-                )
-
-                if Path(venv_python).exists():
-                    cmd = [venv_python, "-m", "pip", "install"] + python_packages
-                    subprocess.run(cmd, check=True)
+                venv_python = venv_path / _VENV_BIN / _VENV_PYTHON
+
+                if venv_python.exists():
+                    subprocess.run(
+                        _pip_install_command(str(venv_python), python_packages),
+                        check=True,
+                        env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"},
+                    )
                     if verbose:
                         print(
                             f"Installed Python packages: {', '.join(python_packages)}"
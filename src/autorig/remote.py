@@ -2,15 +2,63 @@
 Remote configuration fetching and cloud integration for AutoRig.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import Any, Dict, Iterable
 from urllib.parse import urlparse
 
 import requests  # type: ignore[import-untyped]
-from rich.console import Console
 
-console = Console()
+from . import __version__
+from ._console import console
+from .utils import get_cache_dir
+
+# Shared session so repeated fetches reuse TCP/TLS connections. Its default
+# Accept-Encoding already advertises every encoding this install can decode
+# (gzip/deflate, plus br/zstd when urllib3 has the optional decoders).
+_session = requests.Session()
+_session.headers["User-Agent"] = f"autorig/{__version__}"
+
+# How long a cached download without ETag/Last-Modified is used as-is
+REMOTE_CACHE_MAX_AGE = 24 * 60 * 60
+
+# (connect, read) timeouts in seconds for remote fetches
+REMOTE_FETCH_TIMEOUT = (5, 30)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _remote_cache_dir(remote_url: str) -> Path:
+    """Directory holding the cached download of a remote URL."""
+    digest = hashlib.sha256(remote_url.encode()).hexdigest()
+    return get_cache_dir() / "remote" / digest
+
+
+def _read_cache_meta(meta_path: Path) -> Dict[str, Any]:
+    """Load the validators stored for a cached download, if any."""
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file and rename it into place."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 class RemoteConfigManager:
@@ -21,40 +69,13 @@ class RemoteConfigManager:
     @staticmethod
     def is_remote_url(config_path: str) -> bool:
         """Check if the config path is a remote URL."""
-        parsed = urlparse(config_path)
-        return parsed.scheme in ["http", "https"]
+        # Schemes are case-insensitive, as with urlparse
+        return config_path[:8].lower().startswith(("http://", "https://"))
 
     @staticmethod
     def fetch_remote_config(remote_url: str) -> Path:
         """Fetch a configuration file from a remote URL."""
-        try:
-            console.print(f"[blue]Fetching remote configuration:[/blue] {remote_url}")
-
-            response = requests.get(remote_url)
-            response.raise_for_status()
-
-            # Create a temporary file to store the remote config
-            parsed_url = urlparse(remote_url)
-            filename = os.path.basename(parsed_url.path) or "remote_config.yaml"
-
-            # Create temporary file
-            temp_dir = Path(tempfile.mkdtemp(prefix="autorig_"))
-            temp_config_path = temp_dir / filename
-
-            with open(temp_config_path, "wb") as f:
-                f.write(response.content)
-
-            console.print(
-                f"[green]Downloaded remote configuration to:[/green] {temp_config_path}"
-            )
-            return temp_config_path
-
-        except requests.exceptions.RequestException as e:
-            console.print(f"[red]Error downloading remote configuration: {e}[/red]")
-            raise
-        except Exception as e:
-            console.print(f"[red]Error processing remote configuration: {e}[/red]")
-            raise
+        return fetch_remote_config(remote_url)
 
     @staticmethod
     def fetch_from_github(owner: str, repo: str, path: str, ref: str = "main") -> Path:
@@ -70,12 +91,115 @@ class RemoteConfigManager:
         return RemoteConfigManager.fetch_remote_config(url)
 
 
+# A fixed pool of locks picked by URL hash: concurrent first fetches of a URL
+# download it once, different URLs mostly run in parallel, and the pool never
+# grows with the number of URLs seen
+_FETCH_LOCK_COUNT = 64
+_fetch_locks = tuple(threading.Lock() for _ in range(_FETCH_LOCK_COUNT))
+
+
+def fetch_remote_config(remote_url: str) -> Path:
+    """
+    Fetch a configuration file from a remote URL.
+
+    Each URL is fetched at most once per process; later calls return the path
+    of the file already downloaded.
+    """
+    with _fetch_locks[hash(remote_url) % _FETCH_LOCK_COUNT]:
+        return _fetch_remote_config(remote_url)
+
+
+async def fetch_remote_config_async(remote_url: str) -> Path:
+    """
+    Fetch a configuration file from a remote URL without blocking the event
+    loop, so several fetches and git operations can overlap.
+    """
+    return await asyncio.to_thread(fetch_remote_config, remote_url)
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_remote_config(remote_url: str) -> Path:
+    """
+    Download a remote configuration file into the cache.
+
+    Downloads are cached under the AutoRig cache directory together with
+    the server's ETag/Last-Modified validators, so later fetches send a
+    conditional request and reuse the cached file on 304 Not Modified.
+    """
+    try:
+        console.print(f"[blue]Fetching remote configuration:[/blue] {remote_url}")
+
+        parsed_url = urlparse(remote_url)
+        filename = os.path.basename(parsed_url.path) or "remote_config.yaml"
+
+        cache_dir = _remote_cache_dir(remote_url)
+        cached_config_path = cache_dir / filename
+        meta_path = cache_dir / ".meta.json"
+
+        headers = {}
+        if cached_config_path.exists():
+            meta = _read_cache_meta(meta_path)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            if not headers:
+                age = time.time() - cached_config_path.stat().st_mtime
+                if age < REMOTE_CACHE_MAX_AGE:
+                    console.print(
+                        f"[green]Using cached remote configuration:[/green] "
+                        f"{cached_config_path}"
+                    )
+                    return cached_config_path
+
+        # Stream the body straight to disk instead of holding it in memory
+        with _session.get(
+            remote_url,
+            headers=headers,
+            stream=True,
+            timeout=REMOTE_FETCH_TIMEOUT,
+        ) as response:
+            if response.status_code == 304 and headers:
+                console.print(
+                    f"[green]Remote configuration unchanged, using cache:[/green] "
+                    f"{cached_config_path}"
+                )
+                return cached_config_path
+            response.raise_for_status()
+
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # iter_content yields the decoded body, so the cache never holds
+            # compressed bytes
+            _write_atomic(
+                cached_config_path,
+                response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+            )
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        _write_atomic(meta_path, [json.dumps(meta).encode()])
+
+        console.print(
+            f"[green]Downloaded remote configuration to:[/green] "
+            f"{cached_config_path}"
+        )
+        return cached_config_path
+
+    except requests.exceptions.RequestException as e:
+        console.print(f"[red]Error downloading remote configuration: {e}[/red]")
+        raise
+    except Exception as e:
+        console.print(f"[red]Error processing remote configuration: {e}[/red]")
+        raise
+
+
 def resolve_config_path(config_path: str) -> str:
     """
-    Resolve a configuration path, handling remote URLs by downloading to temporary location.
+    Resolve a configuration path, handling remote URLs by downloading to the cache.
     Returns the local path to the configuration file.
     """
     if RemoteConfigManager.is_remote_url(config_path):
-        temp_path = RemoteConfigManager.fetch_remote_config(config_path)
-        return str(temp_path)
+        local_path = fetch_remote_config(config_path)
+        return str(local_path)
     return config_path
@@ -2,184 +2,194 @@
 JSON Schema for AutoRig configuration validation.
 """
 
+import functools
 from typing import Any, Dict
 
-
-def get_config_schema() -> Dict[str, Any]:
-    """
-    Returns the JSON schema for AutoRig configuration files.
-    """
-    return {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "type": "object",
-        "required": ["name"],
-        "properties": {
-            "name": {
-                "type": "string",
-                "description": "Name of the configuration",
-                "minLength": 1,
-                "maxLength": 200,
+# Built once at import; get_config_schema() hands out this same object
+_SCHEMA: Dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "Name of the configuration",
+            "minLength": 1,
+            "maxLength": 200,
+        },
+        "variables": {
+            "type": "object",
+            "description": "Variables available for template rendering",
+            "additionalProperties": True,
+            "default": {},
+        },
+        "system": {
+            "type": "object",
+            "description": "System package configuration",
+            "properties": {
+                "packages": {
+                    "type": "array",
+                    "items": {"type": "string", "minLength": 1},
+                    "default": [],
+                }
             },
-            "variables": {
-                "type": "object",
-                "description": "Variables available for template rendering",
-                "additionalProperties": True,
-                "default": {},
+            "additionalProperties": False,
+            "default": {},
+        },
+        "git": {
+            "type": "object",
+            "description": "Git repository configuration",
+            "properties": {
+                "repositories": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["url", "path"],
+                        "properties": {
+                            "url": {
+                                "type": "string",
+                                "format": "uri",
+                                "description": "Git repository URL",
+                            },
+                            "path": {
+                                "type": "string",
+                                "description": "Local path to clone repository",
+                            },
+                            "branch": {"type": "string", "default": "main"},
+                            "depth": {
+                                "type": ["integer", "null"],
+                                "minimum": 0,
+                                "description": "Commits of history to clone (0 = full)",
+                                "default": 1,
+                            },
+                        },
+                        "additionalProperties": False,
+                    },
+                    "default": [],
+                }
             },
-            "system": {
+            "additionalProperties": False,
+            "default": {},
+        },
+        "dotfiles": {
+            "type": "array",
+            "description": "Dotfile configuration",
+            "items": {
                 "type": "object",
-                "description": "System package configuration",
+                "required": ["source", "target"],
                 "properties": {
-                    "packages": {
-                        "type": "array",
-                        "items": {"type": "string", "minLength": 1},
-                        "default": [],
-                    }
+                    "source": {
+                        "type": "string",
+                        "description": "Source file path (relative to config)",
+                    },
+                    "target": {
+                        "type": "string",
+                        "description": "Target file path (absolute on system)",
+                    },
                 },
                 "additionalProperties": False,
-                "default": {},
             },
-            "git": {
+            "default": [],
+        },
+        "scripts": {
+            "type": "array",
+            "description": "Custom script configuration",
+            "items": {"$ref": "#/definitions/script_item"},
+            "default": [],
+        },
+        "hooks": {
+            "type": "object",
+            "description": "Pre/post hooks for different operations",
+            "properties": {
+                "pre_system": {"$ref": "#/definitions/scripts"},
+                "post_system": {"$ref": "#/definitions/scripts"},
+                "pre_git": {"$ref": "#/definitions/scripts"},
+                "post_git": {"$ref": "#/definitions/scripts"},
+                "pre_dotfiles": {"$ref": "#/definitions/scripts"},
+                "post_dotfiles": {"$ref": "#/definitions/scripts"},
+                "pre_scripts": {"$ref": "#/definitions/scripts"},
+                "post_scripts": {"$ref": "#/definitions/scripts"},
+            },
+            "additionalProperties": False,
+            "default": {},
+        },
+        "profiles": {
+            "type": "object",
+            "description": "Profile-specific configurations",
+            "additionalProperties": {
                 "type": "object",
-                "description": "Git repository configuration",
                 "properties": {
-                    "repositories": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "required": ["url", "path"],
-                            "properties": {
-                                "url": {
-                                    "type": "string",
-                                    "format": "uri",
-                                    "description": "Git repository URL",
-                                },
-                                "path": {
-                                    "type": "string",
-                                    "description": "Local path to clone repository",
-                                },
-                                "branch": {"type": "string", "default": "main"},
-                            },
-                            "additionalProperties": False,
-                        },
-                        "default": [],
-                    }
+                    "system": {"$ref": "#/properties/system"},
+                    "git": {"$ref": "#/properties/git"},
+                    "dotfiles": {"$ref": "#/properties/dotfiles"},
+                    "scripts": {"$ref": "#/definitions/scripts"},
+                    "hooks": {"$ref": "#/properties/hooks"},
                 },
                 "additionalProperties": False,
-                "default": {},
             },
-            "dotfiles": {
-                "type": "array",
-                "description": "Dotfile configuration",
-                "items": {
-                    "type": "object",
-                    "required": ["source", "target"],
-                    "properties": {
-                        "source": {
-                            "type": "string",
-                            "description": "Source file path (relative to config)",
-                        },
-                        "target": {
-                            "type": "string",
-                            "description": "Target file path (absolute on system)",
-                        },
-                    },
-                    "additionalProperties": False,
+            "default": {},
+        },
+    },
+    "additionalProperties": False,
+    "definitions": {
+        "script_item": {
+            "type": "object",
+            "required": ["command"],
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "Shell command to execute",
                 },
-                "default": [],
-            },
-            "scripts": {
-                "type": "array",
-                "description": "Custom script configuration",
-                "items": {
-                    "type": "object",
-                    "required": ["command"],
-                    "properties": {
-                        "command": {
-                            "type": "string",
-                            "description": "Shell command to execute",
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Description of the script",
-                        },
-                        "cwd": {
-                            "type": "string",
-                            "description": "Working directory for the script",
-                        },
-                        "when": {
-                            "type": "string",
-                            "enum": ["pre", "post", "both"],
-                            "description": "When to run the script",
-                            "default": "post",
-                        },
-                    },
-                    "additionalProperties": False,
+                "description": {
+                    "type": "string",
+                    "description": "Description of the script",
                 },
-                "default": [],
-            },
-            "hooks": {
-                "type": "object",
-                "description": "Pre/post hooks for different operations",
-                "properties": {
-                    "pre_system": {"$ref": "#/definitions/scripts"},
-                    "post_system": {"$ref": "#/definitions/scripts"},
-                    "pre_git": {"$ref": "#/definitions/scripts"},
-                    "post_git": {"$ref": "#/definitions/scripts"},
-                    "pre_dotfiles": {"$ref": "#/definitions/scripts"},
-                    "post_dotfiles": {"$ref": "#/definitions/scripts"},
-                    "pre_scripts": {"$ref": "#/definitions/scripts"},
-                    "post_scripts": {"$ref": "#/definitions/scripts"},
+                "cwd": {
+                    "type": "string",
+                    "description": "Working directory for the script",
                 },
-                "additionalProperties": False,
-                "default": {},
-            },
-            "profiles": {
-                "type": "object",
-                "description": "Profile-specific configurations",
-                "additionalProperties": {
-                    "type": "object",
-                    "properties": {
-                        "system": {"$ref": "#/properties/system"},
-                        "git": {"$ref": "#/properties/git"},
-                        "dotfiles": {"$ref": "#/properties/dotfiles"},
-                        "scripts": {"$ref": "#/properties/scripts"},
-                        "hooks": {"$ref": "#/properties/hooks"},
-                    },
-                    "additionalProperties": False,
+                "when": {
+                    "type": "string",
+                    "enum": ["pre", "post", "both"],
+                    "description": "When to run the script",
+                    "default": "post",
+                },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Run alongside adjacent parallel scripts",
+                    "default": False,
                 },
-                "default": {},
             },
+            "additionalProperties": False,
         },
-        "additionalProperties": False,
-        "definitions": {
-            "scripts": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "required": ["command"],
-                    "properties": {
-                        "command": {
-                            "type": "string",
-                            "description": "Shell command to execute",
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Description of the script",
-                        },
-                        "cwd": {
-                            "type": "string",
-                            "description": "Working directory for the script",
-                        },
-                        "when": {
-                            "type": "string",
-                            "enum": ["pre", "post", "both"],
-                            "description": "When to run the script",
-                            "default": "post",
-                        },
-                    },
-                    "additionalProperties": False,
-                },
-            }
+        "scripts": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/script_item"},
         },
-    }
+    },
+}
+
+
+def get_config_schema() -> Dict[str, Any]:
+    """
+    Returns the JSON schema for AutoRig configuration files.
+
+    The schema is shared; callers must not modify it.
+    """
+    return _SCHEMA
+
+
+@functools.lru_cache(maxsize=None)
+def get_config_validator() -> Any:
+    """
+    Returns a jsonschema validator for the configuration schema.
+
+    The schema is checked and the validator built once per process instead of
+    on every ``jsonschema.validate`` call.
+    """
+    import jsonschema  # type: ignore[import-untyped]
+
+    schema = get_config_schema()
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
@@ -1,16 +1,24 @@
 import os
 import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional, Dict
-from rich.console import Console
+from typing import Any, List, Optional, Dict, Set, Tuple
+from autorig._console import console
 from autorig.config import Dotfile
 from autorig.notifications import ProgressTracker
 from autorig.state import OperationTracker
 from autorig.templating import TemplateRenderer
 from logging import Logger
 
-console = Console()
+# Upper bound on threads used to link dotfiles when no job count is given
+DEFAULT_JOBS = 32
+
+
+def _skip(*args: Any) -> None:
+    """Stand-in for filesystem mutations in dry-run mode."""
 
 
 class DotfileService:
@@ -22,6 +30,8 @@ class DotfileService:
         progress_tracker: ProgressTracker,
         dry_run: bool = False,
         force: bool = False,
+        verbose: bool = False,
+        jobs: Optional[int] = None,
     ):
         self.config_path = config_path
         self.renderer = renderer
@@ -29,6 +39,18 @@ class DotfileService:
         self.progress_tracker = progress_tracker
         self.dry_run = dry_run
         self.force = force
+        self.verbose = verbose
+        self.jobs = jobs
+        # Serializes tracker updates made by linking threads
+        self._lock = threading.Lock()
+        # Suffix shared by all backups made in one link_dotfiles call
+        self._backup_stamp = time.strftime("%Y%m%d-%H%M%S")
+        # Parent directories already created during this link_dotfiles call
+        self._created_dirs: Set[Path] = set()
+        if dry_run:
+            # Shadow the filesystem mutations once, instead of checking
+            # dry_run around each of them
+            self._move_to_backup = self._delete_target = _skip  # type: ignore[method-assign]
 
     def link_dotfiles(
         self,
@@ -43,196 +65,243 @@ class DotfileService:
         console.print(f"[bold]Linking {len(dotfiles)} dotfiles...[/bold]")
         self.logger.info(f"Linking {len(dotfiles)} dotfiles")
         config_dir = Path(self.config_path).parent.absolute()
+        self._backup_stamp = time.strftime("%Y%m%d-%H%M%S")
+        self._created_dirs = set()
 
+        total = len(dotfiles)
+
+        # Dotfiles sharing a target are linked in order by the same worker;
+        # group by the expanded path so "~/.vimrc" and "/home/u/.vimrc" match
+        by_target: Dict[str, List[Tuple[int, Dotfile]]] = {}
         for i, df in enumerate(dotfiles, 1):
+            key = os.path.abspath(os.path.expanduser(df.target))
+            by_target.setdefault(key, []).append((i, df))
+        groups = list(by_target.values())
+
+        def link_group(group: List[Tuple[int, Dotfile]]) -> None:
+            for i, df in group:
+                self._link_dotfile(df, i, total, config_dir, variables, tracker)
+
+        workers = min(self.jobs or DEFAULT_JOBS, len(groups))
+        if workers <= 1:
+            for group in groups:
+                link_group(group)
+            return
+
+        # Linking is dominated by filesystem syscalls, so threads overlap well
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in as_completed(
+                [executor.submit(link_group, group) for group in groups]
+            ):
+                future.result()
+
+    def _link_dotfile(
+        self,
+        df: Dotfile,
+        i: int,
+        total: int,
+        config_dir: Path,
+        variables: Dict,
+        tracker: Optional[OperationTracker],
+    ) -> None:
+        try:
+            self.logger.debug(f"Processing dotfile {i}/{total}: {df.target}")
+
+            # Resolve source relative to config file location
+            source = (config_dir / os.path.expanduser(df.source)).resolve()
+            target = Path(os.path.expanduser(df.target))
+
+            # Security check: ensure source is within config directory
             try:
+                source.relative_to(config_dir)
+            except ValueError:
                 console.print(
-                    f"[dim]Processing dotfile {i}/{len(dotfiles)}: {df.target}[/dim]"
+                    f"[red]Security error: Source path outside config directory: {source}[/red]"
                 )
-                self.logger.debug(
-                    f"Processing dotfile {i}/{len(dotfiles)}: {df.target}"
+                self.logger.error(
+                    f"Security error: Source path outside config directory: {source}"
                 )
+                self._record_change(
+                    tracker,
+                    "security_error",
+                    str(target),
+                    error="source_outside_config",
+                    source=str(source),
+                )
+                self._update_progress(f"Security error: {df.target}")
+                return
 
-                # Resolve source relative to config file location
-                source = (config_dir / os.path.expanduser(df.source)).resolve()
-                target = Path(os.path.expanduser(df.target))
-
-                # Security check: ensure source is within config directory
-                try:
-                    source.relative_to(config_dir)
-                except ValueError:
-                    console.print(
-                        f"[red]Security error: Source path outside config directory: {source}[/red]"
-                    )
-                    self.logger.error(
-                        f"Security error: Source path outside config directory: {source}"
-                    )
-                    if tracker:
-                        tracker.record_change(
-                            "security_error",
-                            str(target),
-                            error="source_outside_config",
-                            source=str(source),
-                        )
-                    self.progress_tracker.update_progress(
-                        f"Security error: {df.target}"
-                    )
-                    continue
-
-                if not source.exists():
-                    console.print(f"[red]Source file not found:[/red] {source}")
-                    self.logger.warning(f"Source file not found: {source}")
-                    if tracker:
-                        tracker.record_change(
-                            "missing_source", str(target), source=str(source)
-                        )
-                    self.progress_tracker.update_progress(f"Missing source: {source}")
-                    continue
-
-                # Handle existing file (backup or force remove)
-                self._handle_existing_target(target, tracker)
-
-                # Ensure parent dir exists
-                if not self.dry_run:
-                    target.parent.mkdir(parents=True, exist_ok=True)
-
-                if self.dry_run:
-                    console.print(
-                        f"[yellow]DRY RUN: Would link {target} -> {source}[/yellow]"
-                    )
-                    if tracker:
-                        tracker.record_change(
-                            "would_create_symlink",
-                            str(target),
-                            source=str(source),
-                            is_template=(source.suffix == ".j2"),
-                        )
-                    self.progress_tracker.update_progress(f"Dry run: {df.target}")
-                    continue
-
-                # Check for template
-                if source.suffix == ".j2":
-                    self._render_template(
-                        source, target, config_dir, variables, df, tracker
-                    )
-                    continue
-
-                # Link file
-                self._create_symlink(source, target, df, tracker)
-
-            except Exception as e:
+            if not source.exists():
+                console.print(f"[red]Source file not found:[/red] {source}")
+                self.logger.warning(f"Source file not found: {source}")
+                self._record_change(
+                    tracker, "missing_source", str(target), source=str(source)
+                )
+                self._update_progress(f"Missing source: {source}")
+                return
+
+            # Handle existing file (backup or force remove)
+            self._handle_existing_target(target, tracker)
+
+            if self.dry_run:
                 console.print(
-                    f"[red]Error processing dotfile {df.source} -> {df.target}: {e}[/red]"
+                    f"[yellow]DRY RUN: Would link {target} -> {source}[/yellow]"
                 )
-                self.logger.error(
-                    f"Error processing dotfile {df.source} -> {df.target}: {e}"
+                self._record_change(
+                    tracker,
+                    "would_create_symlink",
+                    str(target),
+                    source=str(source),
+                    is_template=(source.suffix == ".j2"),
+                )
+                self._update_progress(f"Dry run: {df.target}")
+                return
+
+            # Ensure parent dir exists; siblings share it, so create it once
+            parent = target.parent
+            if parent not in self._created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(parent)
+
+            # Check for template
+            if source.suffix == ".j2":
+                self._render_template(
+                    source, target, config_dir, variables, df, tracker
                 )
-                if tracker:
-                    tracker.record_change(
-                        "dotfile_error", df.target, source=df.source, error=str(e)
-                    )
-                self.progress_tracker.update_progress(f"Error: {df.target}")
+                return
+
+            # Link file
+            self._create_symlink(source, target, df, tracker)
+
+        except Exception as e:
+            console.print(
+                f"[red]Error processing dotfile {df.source} -> {df.target}: {e}[/red]"
+            )
+            self.logger.error(
+                f"Error processing dotfile {df.source} -> {df.target}: {e}"
+            )
+            self._record_change(
+                tracker, "dotfile_error", df.target, source=df.source, error=str(e)
+            )
+            self._update_progress(f"Error: {df.target}")
+
+    def _record_change(
+        self, tracker: Optional[OperationTracker], action: str, path: str, **details
+    ) -> None:
+        """Record a change on the tracker; safe to call from worker threads."""
+        if tracker:
+            with self._lock:
+                tracker.record_change(action, path, **details)
+
+    def _update_progress(self, step_description: str) -> None:
+        """Advance the progress tracker; safe to call from worker threads."""
+        with self._lock:
+            self.progress_tracker.update_progress(step_description)
 
     def _handle_existing_target(
         self, target: Path, tracker: Optional[OperationTracker]
     ):
-        original_exists = target.exists() or target.is_symlink()
-        original_is_symlink = target.is_symlink()
-        original_path = (
-            str(target.resolve())
-            if target.is_symlink()
-            else str(target) if target.exists() else None
-        )
-
-        if target.exists() or target.is_symlink():
-            if not self.force:
-                # Backup existing
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-                backup = Path(f"{target}.{timestamp}.bak")
-                console.print(
-                    f"[yellow]Backing up existing {target} to {backup}[/yellow]"
-                )
-                self.logger.info(f"Backing up {target} to {backup}")
-
-                # Record the backup action
-                if tracker:
-                    tracker.record_change(
-                        "backup_file",
-                        str(target),
-                        backup_path=str(backup),
-                        exists=original_exists,
-                        is_symlink=original_is_symlink,
-                        original_path=original_path,
-                    )
-
-                if not self.dry_run:
-                    if target.is_symlink():
-                        target.unlink()
-                    else:
-                        shutil.move(str(target), str(backup))
-            else:
-                console.print(
-                    f"[yellow]Force mode: removing existing {target}[/yellow]"
-                )
-                self.logger.info(f"Force mode: removing existing {target}")
-                # Record the deletion action
-                if tracker:
-                    tracker.record_change(
-                        "deleted_file",
-                        str(target),
-                        is_symlink=original_is_symlink,
-                        original_path=original_path,
-                    )
-
-                if not self.dry_run:
-                    if target.is_symlink():
-                        target.unlink()
-                    else:
-                        (target.unlink() if target.is_file() else shutil.rmtree(target))
+        # One lstat answers every existence/type question below
+        try:
+            st = os.lstat(target)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        original_is_symlink = stat.S_ISLNK(st.st_mode)
+        original_path = str(target.resolve()) if original_is_symlink else str(target)
+
+        if not self.force:
+            # Backup existing
+            backup = Path(f"{target}.{self._backup_stamp}.bak")
+            console.print(f"[yellow]Backing up existing {target} to {backup}[/yellow]")
+            self.logger.info(f"Backing up {target} to {backup}")
+
+            # Record the backup action
+            self._record_change(
+                tracker,
+                "backup_file",
+                str(target),
+                backup_path=str(backup),
+                exists=True,
+                is_symlink=original_is_symlink,
+                original_path=original_path,
+            )
+
+            self._move_to_backup(target, backup, original_is_symlink)
+        else:
+            console.print(f"[yellow]Force mode: removing existing {target}[/yellow]")
+            self.logger.info(f"Force mode: removing existing {target}")
+            # Record the deletion action
+            self._record_change(
+                tracker,
+                "deleted_file",
+                str(target),
+                is_symlink=original_is_symlink,
+                original_path=original_path,
+            )
+
+            self._delete_target(target, st)
+
+    def _move_to_backup(self, target: Path, backup: Path, is_symlink: bool) -> None:
+        if is_symlink:
+            target.unlink()
+        else:
+            # The backup sits next to the target, so a plain rename
+            # almost always works; shutil.move covers the rest
+            try:
+                os.rename(target, backup)
+            except OSError:
+                shutil.move(str(target), str(backup))
+
+    def _delete_target(self, target: Path, st: os.stat_result) -> None:
+        if stat.S_ISDIR(st.st_mode):
+            shutil.rmtree(target)
+        else:
+            target.unlink()
 
     def _render_template(self, source, target, config_dir, variables, df, tracker):
         try:
             # Render relative path from config_dir
             rel_source = source.relative_to(config_dir)
             self.renderer.render(str(rel_source), variables, target)
-            console.print(f"[green]Rendered {target} from {source}[/green]")
+            if self.verbose:
+                console.print(f"[green]Rendered {target} from {source}[/green]")
             self.logger.info(f"Rendered template {source} to {target}")
-            if tracker:
-                tracker.record_change(
-                    "rendered_from_template",
-                    str(target),
-                    source=str(source),
-                )
-            self.progress_tracker.update_progress(f"Rendered: {df.target}")
+            self._record_change(
+                tracker,
+                "rendered_from_template",
+                str(target),
+                source=str(source),
+            )
+            self._update_progress(f"Rendered: {df.target}")
         except Exception as e:
             console.print(f"[red]Failed to render {target}: {e}[/red]")
             self.logger.error(f"Template render failed for {target}: {e}")
-            if tracker:
-                tracker.record_change(
-                    "failed_render",
-                    str(target),
-                    source=str(source),
-                    error=str(e),
-                )
-            self.progress_tracker.update_progress(f"Failed render: {df.target}")
+            self._record_change(
+                tracker,
+                "failed_render",
+                str(target),
+                source=str(source),
+                error=str(e),
+            )
+            self._update_progress(f"Failed render: {df.target}")
 
     def _create_symlink(self, source, target, df, tracker):
         try:
-            target.symlink_to(source)
-            console.print(f"[green]Linked {target} -> {source}[/green]")
+            os.symlink(source, target)
+            if self.verbose:
+                console.print(f"[green]Linked {target} -> {source}[/green]")
             self.logger.info(f"Linked {target} -> {source}")
-            if tracker:
-                tracker.record_change(
-                    "created_symlink",
-                    str(target),
-                    source=str(source),
-                )
-            self.progress_tracker.update_progress(f"Linked: {df.target}")
+            self._record_change(
+                tracker,
+                "created_symlink",
+                str(target),
+                source=str(source),
+            )
+            self._update_progress(f"Linked: {df.target}")
         except Exception as e:
             console.print(f"[red]Failed to link {target}: {e}[/red]")
             self.logger.error(f"Link failed for {target}: {e}")
-            if tracker:
-                tracker.record_change(
-                    "failed_symlink", str(target), source=str(source), error=str(e)
-                )
-            self.progress_tracker.update_progress(f"Failed link: {df.target}")
+            self._record_change(
+                tracker, "failed_symlink", str(target), source=str(source), error=str(e)
+            )
+            self._update_progress(f"Failed link: {df.target}")
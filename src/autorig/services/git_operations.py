@@ -1,24 +1,106 @@
 """Low-level git operations module."""
 
 import asyncio
+import functools
+import importlib.util
+import os
+import shutil
+from asyncio.subprocess import PIPE
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from logging import Logger
 
 
+def git_env() -> Dict[str, str]:
+    """Environment for git subprocesses that never blocks on a credential prompt."""
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+# Options for commands that fetch: protocol v2 only advertises the refs the
+# client asks for (the default from git 2.26, requested explicitly for older)
+GIT_FETCH_OPTIONS = ("-c", "protocol.version=2")
+
+
+# Repositories must not be placed under these (resolved) directories
+_FORBIDDEN_REPO_ROOTS = (Path("/tmp").resolve(),)
+
+
+def is_safe_repo_path(path: Union[str, Path]) -> bool:
+    """
+    Check that a repository path does not end up in a forbidden location.
+
+    The path is expanded and resolved first, so ``..`` components and
+    symlinks are judged by where they actually lead.
+    """
+    resolved = Path(os.path.expanduser(path)).resolve()
+    return not any(resolved.is_relative_to(root) for root in _FORBIDDEN_REPO_ROOTS)
+
+
+@functools.lru_cache(maxsize=None)
+def git_executable() -> str:
+    """Absolute path of the git binary, looked up once so spawns skip PATH."""
+    return shutil.which("git") or "git"
+
+
+@functools.lru_cache(maxsize=None)
+def _pygit2() -> Optional[Any]:
+    """Return the pygit2 module if it is installed, else None."""
+    if importlib.util.find_spec("pygit2") is None:
+        return None
+    import pygit2  # type: ignore[import-not-found]
+
+    return pygit2
+
+
+def _porcelain_status(pygit2: Any, path: Path) -> str:
+    """Format ``Repository.status()`` like ``git status --porcelain``."""
+    index_codes = (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    )
+    worktree_codes = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_RENAMED, "R"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    )
+
+    lines = []
+    for file_path, flags in sorted(pygit2.Repository(str(path)).status().items()):
+        if flags & pygit2.GIT_STATUS_IGNORED:
+            continue
+        if flags & pygit2.GIT_STATUS_CONFLICTED:
+            code = "UU"
+        elif flags & pygit2.GIT_STATUS_WT_NEW:
+            code = "??"
+        else:
+            x = next((c for flag, c in index_codes if flags & flag), " ")
+            y = next((c for flag, c in worktree_codes if flags & flag), " ")
+            code = x + y
+        lines.append(f"{code} {file_path}\n")
+    return "".join(lines)
+
+
 class GitOperations:
     """Handles low-level git operations."""
 
     def __init__(self, logger: Logger, dry_run: bool = False):
         self.logger = logger
         self.dry_run = dry_run
+        self._env = git_env()
 
     async def clone(
-        self, url: str, path: Path, branch: str = "main"
+        self, url: str, path: Path, branch: str = "main", shallow: bool = False
     ) -> Tuple[bool, str, Optional[str]]:
         """
         Clone a git repository.
 
+        With ``shallow``, only the tip of the branch is fetched, and file
+        contents are downloaded lazily (``--depth=1 --filter=blob:none``).
+
         Returns:
             Tuple of (success, stdout, stderr)
         """
@@ -27,16 +109,20 @@ class GitOperations:
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
 
+        options = ["--depth=1", "--filter=blob:none"] if shallow else []
         try:
             process = await asyncio.create_subprocess_exec(
-                "git",
+                git_executable(),
+                *GIT_FETCH_OPTIONS,
                 "clone",
+                *options,
                 "-b",
                 branch,
                 url,
                 str(path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=PIPE,
+                stderr=PIPE,
+                env=self._env,
             )
             stdout, stderr = await process.communicate()
 
@@ -51,6 +137,34 @@ class GitOperations:
             self.logger.error(f"Exception cloning {url}: {e}")
             return False, "", str(e)
 
+    async def clone_all(
+        self,
+        specs: Iterable[Tuple[str, Path, str]],
+        concurrency: int = 8,
+        shallow: bool = False,
+    ) -> List[Tuple[bool, str, Optional[str]]]:
+        """
+        Clone several repositories concurrently.
+
+        Args:
+            specs: (url, path, branch) for each repository
+            concurrency: Maximum number of clones running at once
+
+        Returns:
+            The clone result for each spec, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def clone_one(
+            url: str, path: Path, branch: str
+        ) -> Tuple[bool, str, Optional[str]]:
+            async with semaphore:
+                return await self.clone(url, path, branch, shallow=shallow)
+
+        return await asyncio.gather(
+            *(clone_one(url, path, branch) for url, path, branch in specs)
+        )
+
     async def pull(self, path: Path) -> Tuple[bool, str, Optional[str]]:
         """
         Pull latest changes in a git repository.
@@ -62,12 +176,14 @@ class GitOperations:
 
         try:
             process = await asyncio.create_subprocess_exec(
-                "git",
+                git_executable(),
+                *GIT_FETCH_OPTIONS,
                 "-C",
                 str(path),
                 "pull",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=PIPE,
+                stderr=PIPE,
+                env=self._env,
             )
             stdout, stderr = await process.communicate()
 
@@ -93,12 +209,13 @@ class GitOperations:
 
         try:
             process = await asyncio.create_subprocess_exec(
-                "git",
+                git_executable(),
                 "-C",
                 str(path),
                 "push",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=PIPE,
+                stderr=PIPE,
+                env=self._env,
             )
             _, stderr = await process.communicate()
 
@@ -117,18 +234,27 @@ class GitOperations:
         """
         Get git status in porcelain format.
 
+        Uses pygit2 in-process when it is installed, avoiding a git
+        subprocess per repository.
+
         Returns:
             Status output string
         """
+        pygit2 = _pygit2()
         try:
+            if pygit2 is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, _porcelain_status, pygit2, path)
+
             process = await asyncio.create_subprocess_exec(
-                "git",
+                git_executable(),
                 "-C",
                 str(path),
                 "status",
                 "--porcelain",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=PIPE,
+                stderr=PIPE,
+                env=self._env,
             )
             stdout, _ = await process.communicate()
             return stdout.decode()
@@ -137,8 +263,13 @@ class GitOperations:
             return ""
 
     def is_git_repo(self, path: Path) -> bool:
-        """Check if path is a git repository."""
-        return (path / ".git").exists()
+        """
+        Check if path is a git repository.
+
+        ``.git`` may be a directory or, for worktrees and submodules, a file
+        pointing at the real git dir; a single stat covers both.
+        """
+        return os.path.exists(os.path.join(path, ".git"))
 
     def validate_path(self, path: str) -> bool:
         """
@@ -147,8 +278,7 @@ class GitOperations:
         Returns:
             True if path is safe, False otherwise
         """
-        expanded_path = path
-        if ".." in expanded_path or expanded_path.startswith("/tmp"):
+        if not is_safe_repo_path(path):
             self.logger.error(f"Invalid repository path: {path}")
             return False
         return True
@@ -1,15 +1,22 @@
 import asyncio
-import os
 import subprocess
+import sys
+from asyncio.subprocess import DEVNULL, PIPE
 from pathlib import Path
-from typing import List, Optional
-from rich.console import Console
+from typing import List, Optional, Tuple
+from autorig._console import console
 from autorig.config import GitRepo
+from autorig.services.git_operations import (
+    GIT_FETCH_OPTIONS,
+    git_env,
+    git_executable,
+    is_safe_repo_path,
+)
 from autorig.notifications import ProgressTracker
 from autorig.state import OperationTracker
 from logging import Logger
 
-console = Console()
+DRAIN_CHUNK_SIZE = 64 * 1024
 
 
 class GitService:
@@ -19,11 +26,14 @@ class GitService:
         progress_tracker: ProgressTracker,
         dry_run: bool = False,
         verbose: bool = False,
+        concurrency: int = 8,
     ):
         self.logger = logger
         self.progress_tracker = progress_tracker
         self.dry_run = dry_run
         self.verbose = verbose
+        self.concurrency = concurrency
+        self._env = git_env()
 
     async def process_repositories(
         self, repos: List[GitRepo], tracker: Optional[OperationTracker] = None
@@ -35,11 +45,52 @@ class GitService:
         console.print(f"[bold]Processing {len(repos)} git repositories...[/bold]")
         self.logger.info(f"Processing {len(repos)} git repositories")
 
-        tasks = []
-        for i, repo in enumerate(repos, 1):
-            tasks.append(self._clone_or_update_repo(repo, i, len(repos), tracker))
+        # Bound the number of git processes running at once
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-        await asyncio.gather(*tasks)
+        async def process_one(repo: GitRepo, index: int) -> None:
+            async with semaphore:
+                await self._clone_or_update_repo(repo, index, len(repos), tracker)
+
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                for i, repo in enumerate(repos, 1):
+                    tg.create_task(process_one(repo, i))
+        else:
+            await asyncio.gather(
+                *(process_one(repo, i) for i, repo in enumerate(repos, 1))
+            )
+
+    async def _run_git(self, *args: str) -> Tuple[int, str]:
+        """
+        Run a git command and return its exit code and stderr.
+
+        Stdout is discarded unless verbose, in which case it is echoed line by
+        line as it arrives instead of being buffered until the process exits.
+        """
+        process = await asyncio.create_subprocess_exec(
+            git_executable(),
+            *args,
+            stdout=PIPE if self.verbose else DEVNULL,
+            stderr=PIPE,
+            env=self._env,
+        )
+        assert process.stderr is not None
+
+        async def echo_stdout() -> None:
+            assert process.stdout is not None
+            async for line in process.stdout:
+                text = line.decode("utf-8", "replace").rstrip()
+                console.print(f"[dim]Git output: {text}[/dim]")
+
+        if self.verbose:
+            # Drain both pipes together so neither can fill up and block git
+            _, stderr = await asyncio.gather(echo_stdout(), process.stderr.read())
+        else:
+            stderr = await process.stderr.read()
+        returncode = await process.wait()
+        # Stderr is only reported on failure, so only decode it then
+        return returncode, stderr.decode("utf-8", "replace") if returncode else ""
 
     async def _clone_or_update_repo(
         self,
@@ -49,11 +100,10 @@ class GitService:
         tracker: Optional[OperationTracker] = None,
     ):
         try:
-            target_path = Path(os.path.expanduser(repo.path))
+            target_path = repo.expanded_path
 
             # Security check for path traversal
-            expanded_path = os.path.expanduser(repo.path)
-            if ".." in expanded_path or expanded_path.startswith("/tmp"):
+            if not is_safe_repo_path(target_path):
                 console.print(
                     f"[red]Security error: Invalid repository path: {repo.path}[/red]"
                 )
@@ -103,30 +153,19 @@ class GitService:
                 return
 
             try:
-                process = await asyncio.create_subprocess_exec(
-                    "git",
-                    "-C",
-                    str(target_path),
-                    "pull",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+                returncode, stderr = await self._run_git(
+                    *GIT_FETCH_OPTIONS, "-C", str(target_path), "pull"
                 )
-                stdout, stderr = await process.communicate()
 
-                if process.returncode == 0:
+                if returncode == 0:
                     console.print(f"[green]Updated {repo.url}[/green]")
-                    if self.verbose and stdout:
-                        console.print(f"[dim]Git output: {stdout.decode()}[/dim]")
                     self.logger.info(f"Updated git repo: {repo.url}")
                     if tracker:
                         tracker.record_change("updated_repo", repo.path, url=repo.url)
                     self.progress_tracker.update_progress(f"Updated: {repo.url}")
                 else:
                     raise subprocess.CalledProcessError(
-                        process.returncode or 1,
-                        ["git", "pull"],
-                        output=stdout.decode(),
-                        stderr=stderr.decode(),
+                        returncode, ["git", "pull"], stderr=stderr
                     )
 
             except subprocess.CalledProcessError as e:
@@ -173,32 +212,31 @@ class GitService:
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                "git",
+            # Only fetch the history that was asked for (the tip by default)
+            shallow_options = (
+                [f"--depth={repo.depth}", "--single-branch", "--no-tags"]
+                if repo.depth
+                else []
+            )
+            returncode, stderr = await self._run_git(
+                *GIT_FETCH_OPTIONS,
                 "clone",
+                *shallow_options,
                 "-b",
                 repo.branch or "main",
                 repo.url,
                 str(target_path),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await process.communicate()
 
-            if process.returncode == 0:
+            if returncode == 0:
                 console.print(f"[green]Cloned {repo.url}[/green]")
-                if self.verbose and stdout:
-                    console.print(f"[dim]Git output: {stdout.decode()}[/dim]")
                 self.logger.info(f"Cloned git repo: {repo.url}")
                 if tracker:
                     tracker.record_change("git_cloned", repo.path, url=repo.url)
                 self.progress_tracker.update_progress(f"Cloned: {repo.url}")
             else:
                 raise subprocess.CalledProcessError(
-                    process.returncode or 1,
-                    ["git", "clone"],
-                    output=stdout.decode(),
-                    stderr=stderr.decode(),
+                    returncode, ["git", "clone"], stderr=stderr
                 )
 
         except subprocess.CalledProcessError as e:
@@ -224,7 +262,7 @@ class GitService:
         console.print(f"[bold]Syncing {len(repos)} git repositories...[/bold]")
 
         async def _sync_one_repo(repo):
-            target_path = Path(os.path.expanduser(repo.path))
+            target_path = repo.expanded_path
             if target_path.exists() and (target_path / ".git").exists():
                 console.print(f"Syncing {repo.path}...")
                 if self.dry_run:
@@ -234,28 +272,36 @@ class GitService:
                 try:
                     # Check for uncommitted changes just to inform
                     status_proc = await asyncio.create_subprocess_exec(
-                        "git",
+                        git_executable(),
                         "-C",
                         str(target_path),
                         "status",
                         "--porcelain",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
+                        stdout=PIPE,
+                        stderr=DEVNULL,
+                        env=self._env,
                     )
-                    stdout, _ = await status_proc.communicate()
+                    assert status_proc.stdout is not None
+                    # Any output at all means the tree is dirty; discard the
+                    # rest in chunks so git is never blocked on a full pipe
+                    dirty = await status_proc.stdout.read(1)
+                    while await status_proc.stdout.read(DRAIN_CHUNK_SIZE):
+                        pass
+                    await status_proc.wait()
 
-                    if stdout.strip():
+                    if dirty:
                         console.print(
                             f"[yellow]Warning: {repo.path} has uncommitted changes.[/yellow]"
                         )
 
                     push_proc = await asyncio.create_subprocess_exec(
-                        "git",
+                        git_executable(),
                         "-C",
                         str(target_path),
                         "push",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
+                        stdout=DEVNULL,
+                        stderr=PIPE,
+                        env=self._env,
                     )
                     _, stderr = await push_proc.communicate()
 
@@ -263,16 +309,20 @@ class GitService:
                         console.print(f"[green]Pushed {repo.path}[/green]")
                         self.logger.info(f"Pushed git repo: {repo.path}")
                     else:
-                        console.print(
-                            f"[red]Failed to push {repo.path}: {stderr.decode()}[/red]"
-                        )
-                        self.logger.error(
-                            f"Failed to push {repo.path}: {stderr.decode()}"
-                        )
+                        error = stderr.decode("utf-8", "replace")
+                        console.print(f"[red]Failed to push {repo.path}: {error}[/red]")
+                        self.logger.error(f"Failed to push {repo.path}: {error}")
                 except Exception as e:
                     console.print(f"[red]Error syncing {repo.path}: {e}[/red]")
                     self.logger.error(f"Error syncing {repo.path}: {e}")
             else:
                 console.print(f"[yellow]Skipping {repo.path}: Not a git repo[/yellow]")
 
-        await asyncio.gather(*[_sync_one_repo(repo) for repo in repos])
+        # Same bound as process_repositories so pushes don't swamp the network
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def sync_one(repo: GitRepo) -> None:
+            async with semaphore:
+                await _sync_one_repo(repo)
+
+        await asyncio.gather(*(sync_one(repo) for repo in repos))
@@ -1,15 +1,53 @@
+import asyncio
+import itertools
 import os
 import subprocess
+import threading
 import shlex
 import re
 from typing import List, Optional
-from rich.console import Console
+from autorig._console import console
 from autorig.config import Script
 from autorig.notifications import ProgressTracker
 from autorig.state import OperationTracker
 from logging import Logger
 
-console = Console()
+# Literal fragments that could indicate command injection; plain substring
+# checks avoid running the regex engine for the most common rejections
+_DANGEROUS_SUBSTRINGS = (
+    "||",  # command chaining
+    "&&",  # command chaining
+    ";",  # command separation
+    "$(( ",  # arithmetic expansion
+    "`",  # command substitution
+)
+# Patterns that need a regex to detect
+_DANGEROUS_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\$\(.*\)",  # command substitution
+        r"eval\s",  # eval command
+        r"exec\s",  # exec command
+        r"source\s",  # source command
+        r"bash\s+-c",  # bash command execution
+        r"sh\s+-c",  # sh command execution
+        r"python.*-c",  # python command execution
+        r"perl.*-e",  # perl command execution
+        r"ruby.*-e",  # ruby command execution
+        r"import\s+os|import\s+sys|import\s+subprocess",  # Python imports in command
+        r"rm\s+-rf",  # dangerous removal
+        r"mv\s+/.*\s+/",  # dangerous move to system directories
+        r"cp\s+/.*\s+/",  # dangerous copy to system directories
+    )
+)
+_DANGEROUS_COMMAND = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in _DANGEROUS_PATTERNS)
+)
+_DANGEROUS_PATHS = ("/etc", "/root", "/boot", "/sys", "/proc")
+# Characters that need a shell to interpret
+_SHELL_METACHARS = re.compile(r"[|><&;$]")
+# Commands made only of these characters need no shell-style parsing
+_PLAIN_COMMAND = re.compile(r"[\w\-./=@+ :]+")
 
 
 class HookService:
@@ -24,6 +62,8 @@ class HookService:
         self.progress_tracker = progress_tracker
         self.dry_run = dry_run
         self.verbose = verbose
+        # Guards the trackers while parallel scripts run in worker threads
+        self._lock = threading.Lock()
 
     def run_hooks(self, hooks: List[Script]):
         """Run hooks (pre/post actions for different stages)."""
@@ -82,74 +122,126 @@ class HookService:
         self.logger.info(f"Running {len(scripts)} post-install scripts")
 
         for i, script in enumerate(scripts, 1):
-            desc = script.description or script.command
-            console.print(f"[dim]Running script {i}/{len(scripts)}: {desc}[/dim]")
-            self.logger.debug(f"Running script {i}/{len(scripts)}: {desc}")
-
-            # Validate script command before execution for security
-            if not self._is_safe_command(script.command):
-                console.print(f"[red]✗ Unsafe command blocked: {script.command}[/red]")
-                self.logger.error(f"Unsafe command blocked: {script.command}")
-                if tracker:
-                    tracker.record_change(
-                        "blocked_unsafe_script", script.command, description=desc
-                    )
-                self.progress_tracker.update_progress(f"Blocked unsafe script: {desc}")
-                continue
+            self._run_script(script, i, len(scripts), tracker)
 
-            cwd = os.path.expanduser(script.cwd) if script.cwd else None
+    async def run_scripts_async(
+        self,
+        scripts: List[Script],
+        tracker: Optional[OperationTracker] = None,
+        max_parallel: int = 4,
+    ):
+        """
+        Run scripts in order, except that consecutive scripts marked
+        ``parallel`` run concurrently, at most max_parallel at a time.
+        """
+        if not scripts:
+            self.logger.debug("No scripts to run")
+            return
 
-            if self.dry_run:
-                console.print(
-                    f"[yellow]DRY RUN: Would execute: {script.command}[/yellow]"
+        console.print(f"[bold]Running {len(scripts)} post-install scripts...[/bold]")
+        self.logger.info(f"Running {len(scripts)} post-install scripts")
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run_one(script: Script, index: int) -> None:
+            async with semaphore:
+                await asyncio.to_thread(
+                    self._run_script, script, index, len(scripts), tracker
                 )
-                if tracker:
-                    tracker.record_change(
-                        "would_execute_script",
-                        script.command,
-                        description=desc,
-                        cwd=cwd,
-                    )
-                self.progress_tracker.update_progress(f"Dry run: {desc}")
-                continue
 
-            try:
-                result = self._run_command_safely(script.command, cwd=cwd)
-                console.print(f"[green]✓ Completed: {desc}[/green]")
-                if result.stdout:
-                    if self.verbose:
-                        console.print(f"[dim]Output: {result.stdout}[/dim]")
-                    else:
-                        console.print(
-                            f"[dim]Output: {result.stdout[:200]}...[/dim]"
-                            if len(result.stdout) > 200
-                            else f"[dim]Output: {result.stdout}[/dim]"
-                        )
-                self.logger.info(f"Script completed: {desc}")
-                if tracker:
-                    tracker.record_change(
-                        "executed_script",
-                        script.command,
-                        description=desc,
-                        status="success",
-                        output=result.stdout[:500] if result.stdout else "",
-                    )
-                self.progress_tracker.update_progress(f"Completed: {desc}")
-            except subprocess.CalledProcessError as e:
-                console.print(f"[red]✗ Failed: {desc} ({e})[/red]")
-                if e.stderr:
-                    console.print(f"[red]Error: {e.stderr}[/red]")
-                self.logger.error(f"Script failed: {desc} - {e}")
-                if tracker:
-                    tracker.record_change(
-                        "executed_script",
-                        script.command,
-                        description=desc,
-                        status="failed",
-                        error=str(e),
-                        stderr=e.stderr if e.stderr else "",
+        numbered = enumerate(scripts, 1)
+        for parallel, group in itertools.groupby(numbered, lambda n: n[1].parallel):
+            if parallel:
+                await asyncio.gather(*(run_one(script, i) for i, script in group))
+            else:
+                for i, script in group:
+                    self._run_script(script, i, len(scripts), tracker)
+
+    def _run_script(
+        self,
+        script: Script,
+        i: int,
+        total: int,
+        tracker: Optional[OperationTracker] = None,
+    ) -> None:
+        desc = script.description or script.command
+        console.print(f"[dim]Running script {i}/{total}: {desc}[/dim]")
+        self.logger.debug(f"Running script {i}/{total}: {desc}")
+
+        # Validate script command before execution for security
+        if not self._is_safe_command(script.command):
+            console.print(f"[red]✗ Unsafe command blocked: {script.command}[/red]")
+            self.logger.error(f"Unsafe command blocked: {script.command}")
+            self._record_change(
+                tracker, "blocked_unsafe_script", script.command, description=desc
+            )
+            self._update_progress(f"Blocked unsafe script: {desc}")
+            return
+
+        cwd = os.path.expanduser(script.cwd) if script.cwd else None
+
+        if self.dry_run:
+            console.print(f"[yellow]DRY RUN: Would execute: {script.command}[/yellow]")
+            self._record_change(
+                tracker,
+                "would_execute_script",
+                script.command,
+                description=desc,
+                cwd=cwd,
+            )
+            self._update_progress(f"Dry run: {desc}")
+            return
+
+        try:
+            result = self._run_command_safely(script.command, cwd=cwd)
+            console.print(f"[green]✓ Completed: {desc}[/green]")
+            if result.stdout:
+                if self.verbose:
+                    console.print(f"[dim]Output: {result.stdout}[/dim]")
+                else:
+                    console.print(
+                        f"[dim]Output: {result.stdout[:200]}...[/dim]"
+                        if len(result.stdout) > 200
+                        else f"[dim]Output: {result.stdout}[/dim]"
                     )
-                self.progress_tracker.update_progress(f"Failed: {desc}")
+            self.logger.info(f"Script completed: {desc}")
+            self._record_change(
+                tracker,
+                "executed_script",
+                script.command,
+                description=desc,
+                status="success",
+                output=result.stdout[:500] if result.stdout else "",
+            )
+            self._update_progress(f"Completed: {desc}")
+        except subprocess.CalledProcessError as e:
+            console.print(f"[red]✗ Failed: {desc} ({e})[/red]")
+            if e.stderr:
+                console.print(f"[red]Error: {e.stderr}[/red]")
+            self.logger.error(f"Script failed: {desc} - {e}")
+            self._record_change(
+                tracker,
+                "executed_script",
+                script.command,
+                description=desc,
+                status="failed",
+                error=str(e),
+                stderr=e.stderr if e.stderr else "",
+            )
+            self._update_progress(f"Failed: {desc}")
+
+    def _record_change(
+        self, tracker: Optional[OperationTracker], action: str, path: str, **details
+    ) -> None:
+        """Record a change on the tracker; safe to call from worker threads."""
+        if tracker:
+            with self._lock:
+                tracker.record_change(action, path, **details)
+
+    def _update_progress(self, step_description: str) -> None:
+        """Advance the progress tracker; safe to call from worker threads."""
+        with self._lock:
+            self.progress_tracker.update_progress(step_description)
 
     def _run_command_safely(
         self, command: str, cwd: Optional[str] = None, capture_output: bool = True
@@ -158,8 +250,7 @@ class HookService:
         Execute a command safely, avoiding shell=True when possible.
         """
         # Check for shell features that require shell=True
-        shell_metachars = {"|", ">", "<", "&", ";", "$"}
-        needs_shell = any(char in command for char in shell_metachars)
+        needs_shell = _SHELL_METACHARS.search(command) is not None
 
         if needs_shell:
             self.logger.debug(f"Command requires shell execution: {command}")
@@ -173,7 +264,12 @@ class HookService:
             )
         else:
             try:
-                args = shlex.split(command)
+                # Commands without quotes or escapes split the same way as
+                # shlex would, so skip its character-by-character parser
+                if _PLAIN_COMMAND.fullmatch(command):
+                    args = command.split()
+                else:
+                    args = shlex.split(command)
                 return subprocess.run(
                     args,
                     shell=False,
@@ -200,44 +296,30 @@ class HookService:
         """
         Perform comprehensive security checks on a command before execution
         """
-        # Check for dangerous patterns that could indicate command injection
-        dangerous_patterns = [
-            r"\|\|",  # command chaining
-            r"&&",  # command chaining
-            r";",  # command separation
-            r"\$\(\( ",  # arithmetic expansion
-            r"`",  # command substitution
-            r"\$\(.*\)",  # command substitution
-            r"eval\s",  # eval command
-            r"exec\s",  # exec command
-            r"source\s",  # source command
-            r"bash\s+-c",  # bash command execution
-            r"sh\s+-c",  # sh command execution
-            r"python.*-c",  # python command execution
-            r"perl.*-e",  # perl command execution
-            r"ruby.*-e",  # ruby command execution
-            r"import\s+os|import\s+sys|import\s+subprocess",  # Python imports in command
-            r"rm\s+-rf",  # dangerous removal
-            r"mv\s+/.*\s+/",  # dangerous move to system directories
-            r"cp\s+/.*\s+/",  # dangerous copy to system directories
-        ]
-
         # Convert to lowercase for broader pattern matching
         command_lower = command.lower()
-        for pattern in dangerous_patterns:
-            if re.search(pattern, command_lower):
+        for substring in _DANGEROUS_SUBSTRINGS:
+            if substring in command_lower:
                 self.logger.warning(
-                    f"Blocked command with dangerous pattern: {pattern}"
+                    f"Blocked command with dangerous pattern: {substring}"
                 )
                 return False
 
+        # One scan over the combined pattern; only look up which pattern
+        # matched when the command is actually rejected
+        if _DANGEROUS_COMMAND.search(command_lower):
+            pattern = next(p for p in _DANGEROUS_PATTERNS if p.search(command_lower))
+            self.logger.warning(
+                f"Blocked command with dangerous pattern: {pattern.pattern}"
+            )
+            return False
+
         # Additional validation: check for dangerous paths
-        dangerous_paths = ["/etc", "/root", "/boot", "/sys", "/proc"]
         parts = command.split()
         for part in parts:
             # Remove quotes and normalize
             clean_part = part.strip("'\"")
-            if any(clean_part.startswith(path) for path in dangerous_paths):
+            if clean_part.startswith(_DANGEROUS_PATHS):
                 self.logger.warning(
                     f"Blocked command with dangerous path: {clean_part}"
                 )
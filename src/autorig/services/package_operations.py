@@ -1,9 +1,66 @@
 """Package manager operations module."""
 
+import shutil
 import subprocess
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, FrozenSet, Tuple, Optional
 from logging import Logger
 
+# Package manager executables, probed in order of preference
+PACKAGE_MANAGERS = (
+    "apt",
+    "dnf",
+    "yum",
+    "pacman",
+    "zypper",
+    "xbps",
+    "apk",
+    "brew",
+    "winget",
+    "choco",
+    "scoop",
+)
+
+# Install command prefixes; package names are appended to the end
+INSTALL_COMMANDS: Dict[str, List[str]] = {
+    "apt": ["sudo", "apt-get", "install", "-y"],
+    "dnf": ["sudo", "dnf", "install", "-y"],
+    "yum": ["sudo", "yum", "install", "-y"],
+    "pacman": ["sudo", "pacman", "-S", "--noconfirm"],
+    "zypper": ["sudo", "zypper", "install", "-y"],
+    "xbps": ["sudo", "xbps-install", "-S"],
+    "apk": ["sudo", "apk", "add"],
+    "brew": ["brew", "install"],
+    "winget": ["winget", "install"],
+    "choco": ["choco", "install", "-y"],
+    "scoop": ["scoop", "install"],
+}
+
+# Commands printing the name of every installed package, one per line
+INSTALLED_QUERY_COMMANDS: Dict[str, List[str]] = {
+    "apt": ["dpkg-query", "-W", "-f=${db:Status-Abbrev} ${Package}\n"],
+    "dnf": ["rpm", "-qa", "--qf", "%{NAME}\n"],
+    "yum": ["rpm", "-qa", "--qf", "%{NAME}\n"],
+    "zypper": ["rpm", "-qa", "--qf", "%{NAME}\n"],
+    "pacman": ["pacman", "-Qq"],
+    "apk": ["apk", "info"],
+    "brew": ["brew", "list", "-1"],
+}
+
+
+def _installed_names(package_manager: str, output: str) -> FrozenSet[str]:
+    """Parse the output of an INSTALLED_QUERY_COMMANDS query into names."""
+    if package_manager == "apt":
+        # Lines look like "ii  git"; the second status letter is "i" only for
+        # installed packages, "rc" ones were removed but left config files
+        return frozenset(
+            line.split()[-1] for line in output.splitlines() if line[1:2] == "i"
+        )
+    return frozenset(output.split())
+
+
+# Managers whose install command accepts a single package at a time
+SINGLE_PACKAGE_MANAGERS = frozenset({"winget"})
+
 
 class PackageOperations:
     """Handles package manager operations."""
@@ -11,63 +68,28 @@ class PackageOperations:
     def __init__(self, logger: Logger, dry_run: bool = False):
         self.logger = logger
         self.dry_run = dry_run
+        self._package_manager: Optional[str] = None
+        self._installed: Optional[FrozenSet[str]] = None
+        self._installed_loaded = False
 
     def get_package_manager(self) -> str:
-        """Detect the system package manager."""
-        try:
-            if subprocess.run(["which", "apt"], capture_output=True).returncode == 0:
-                return "apt"
-            elif subprocess.run(["which", "dnf"], capture_output=True).returncode == 0:
-                return "dnf"
-            elif subprocess.run(["which", "yum"], capture_output=True).returncode == 0:
-                return "yum"
-            elif (
-                subprocess.run(["which", "pacman"], capture_output=True).returncode == 0
-            ):
-                return "pacman"
-            elif (
-                subprocess.run(["which", "zypper"], capture_output=True).returncode == 0
-            ):
-                return "zypper"
-            elif subprocess.run(["which", "xbps"], capture_output=True).returncode == 0:
-                return "xbps"
-            elif subprocess.run(["which", "apk"], capture_output=True).returncode == 0:
-                return "apk"
-            elif subprocess.run(["which", "brew"], capture_output=True).returncode == 0:
-                return "brew"
-            elif (
-                subprocess.run(["which", "winget"], capture_output=True).returncode == 0
-            ):
-                return "winget"
-            elif (
-                subprocess.run(["which", "choco"], capture_output=True).returncode == 0
-            ):
-                return "choco"
-            elif (
-                subprocess.run(["which", "scoop"], capture_output=True).returncode == 0
-            ):
-                return "scoop"
-            else:
-                return "unknown"
-        except Exception:
-            return "unknown"
+        """Detect the system package manager (probed once per instance)."""
+        if self._package_manager is None:
+            self._package_manager = next(
+                (pm for pm in PACKAGE_MANAGERS if shutil.which(pm)), "unknown"
+            )
+        return self._package_manager
 
     def get_install_command(self, package_manager: str, package: str) -> List[str]:
         """Get the install command for a package manager."""
-        commands: Dict[str, List[str]] = {
-            "apt": ["sudo", "apt-get", "install", "-y", package],
-            "dnf": ["sudo", "dnf", "install", "-y", package],
-            "yum": ["sudo", "yum", "install", "-y", package],
-            "pacman": ["sudo", "pacman", "-S", "--noconfirm", package],
-            "zypper": ["sudo", "zypper", "install", "-y", package],
-            "xbps": ["sudo", "xbps-install", "-S", package],
-            "apk": ["sudo", "apk", "add", package],
-            "brew": ["brew", "install", package],
-            "winget": ["winget", "install", package],
-            "choco": ["choco", "install", package, "-y"],
-            "scoop": ["scoop", "install", package],
-        }
-        return commands.get(package_manager, [])
+        return self._batch_install_command(package_manager, [package])
+
+    def _batch_install_command(
+        self, package_manager: str, packages: List[str]
+    ) -> List[str]:
+        """Get a single install command covering all of packages."""
+        prefix = INSTALL_COMMANDS.get(package_manager)
+        return prefix + packages if prefix else []
 
     def install_package(
         self, package: str, package_manager: Optional[str] = None
@@ -78,6 +100,22 @@ class PackageOperations:
         Returns:
             Tuple of (success, error_message)
         """
+        return self.install_packages([package], package_manager)
+
+    def install_packages(
+        self, packages: List[str], package_manager: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        Install several packages with one package manager invocation.
+
+        Managers that only take one package per call are run once per package.
+
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if not packages:
+            return True, ""
+
         if package_manager is None:
             package_manager = self.get_package_manager()
 
@@ -85,37 +123,78 @@ class PackageOperations:
             self.logger.error("Unknown package manager")
             return False, "Unknown package manager"
 
-        command = self.get_install_command(package_manager, package)
+        if package_manager in SINGLE_PACKAGE_MANAGERS and len(packages) > 1:
+            errors = []
+            for package in packages:
+                success, error_msg = self.install_packages([package], package_manager)
+                if not success:
+                    errors.append(error_msg)
+            return not errors, "\n".join(errors)
+
+        command = self._batch_install_command(package_manager, list(packages))
         if not command:
             self.logger.error(f"Unknown package manager: {package_manager}")
             return False, f"Unknown package manager: {package_manager}"
 
-        self.logger.info(f"Installing {package} using {package_manager}")
+        names = " ".join(packages)
+        self.logger.info(f"Installing {names} using {package_manager}")
 
         if self.dry_run:
-            self.logger.info(f"DRY RUN: Would install {package}")
+            self.logger.info(f"DRY RUN: Would install {names}")
             return True, ""
 
         try:
-            subprocess.run(command, capture_output=True, text=True, check=True)
-            self.logger.info(f"Successfully installed: {package}")
+            # Progress output is never shown, so don't pull it into memory;
+            # stderr is kept for the error message
+            subprocess.run(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+            self.logger.info(f"Successfully installed: {names}")
+            # The installed package set is stale now
+            self._installed_loaded = False
             return True, ""
         except subprocess.CalledProcessError as e:
             error_msg = e.stderr or str(e)
-            self.logger.error(f"Failed to install {package}: {error_msg}")
+            self.logger.error(f"Failed to install {names}: {error_msg}")
             return False, error_msg
         except Exception as e:
             error_msg = str(e)
-            self.logger.error(f"Exception installing {package}: {error_msg}")
+            self.logger.error(f"Exception installing {names}: {error_msg}")
             return False, error_msg
 
     def is_installed(self, package: str) -> bool:
         """Check if a package is installed."""
-        try:
-            result = subprocess.run(["which", package], capture_output=True)
-            return result.returncode == 0
-        except Exception:
-            return False
+        installed = self._installed_packages()
+        if installed is not None:
+            return package in installed
+
+        # No package database query for this manager; look for an executable
+        return shutil.which(package) is not None
+
+    def _installed_packages(self) -> Optional[FrozenSet[str]]:
+        """
+        Names of all installed packages, queried once and cached.
+
+        Returns None if the package manager has no name query or it failed.
+        """
+        if not self._installed_loaded:
+            self._installed = None
+            command = INSTALLED_QUERY_COMMANDS.get(self.get_package_manager())
+            if command:
+                try:
+                    result = subprocess.run(command, capture_output=True, text=True)
+                    if result.returncode == 0:
+                        self._installed = _installed_names(
+                            self.get_package_manager(), result.stdout
+                        )
+                except Exception:
+                    pass
+            self._installed_loaded = True
+        return self._installed
 
     def list_installed(self, package_manager: Optional[str] = None) -> List[str]:
         """List installed packages."""
@@ -1,12 +1,10 @@
-from typing import List, Optional
-from rich.console import Console
+from typing import List, Optional, Tuple
+from autorig._console import console
 from autorig.installers.base import SystemInstaller
 from autorig.notifications import ProgressTracker
 from autorig.state import OperationTracker
 from logging import Logger
 
-console = Console()
-
 
 class PackageService:
     def __init__(
@@ -34,28 +32,29 @@ class PackageService:
             console.print(
                 f"[yellow]DRY RUN: Would install: {', '.join(packages)}[/yellow]"
             )
-            for pkg in packages:
-                if tracker:
-                    tracker.record_change("would_install_package", pkg)
-                self.progress_tracker.update_progress(f"Dry run: {pkg}")
+            if tracker:
+                tracker.record_change_many("would_install_package", packages)
+            # Still advances one step per package, but in a single update
+            self.progress_tracker.update_progress(
+                f"Dry run: {len(packages)} packages", steps=len(packages)
+            )
             return
 
         try:
-            success_count = 0
-            failures = []
-            for pkg in packages:
-                if self.installer.install([pkg]):
-                    success_count += 1
+            # One invocation lets the package manager resolve everything at once
+            if self.installer.install(packages):
+                success_count = len(packages)
+                failures: List[str] = []
+                for pkg in packages:
                     if tracker:
                         tracker.record_change(
                             "installed_package", pkg, status="success"
                         )
+                    # apply() budgets one progress step per package
                     self.progress_tracker.update_progress(f"Installed: {pkg}")
-                else:
-                    failures.append(pkg)
-                    if tracker:
-                        tracker.record_change("installed_package", pkg, status="failed")
-                    self.progress_tracker.update_progress(f"Failed: {pkg}")
+            else:
+                # Retry one by one to find out which packages failed
+                success_count, failures = self._install_individually(packages, tracker)
 
             if success_count == len(packages):
                 console.print("[green]System packages installed successfully.[/green]")
@@ -75,3 +74,22 @@ class PackageService:
             console.print(f"[red]Error during package installation: {e}[/red]")
             self.logger.error(f"Package installation error: {e}")
             raise
+
+    def _install_individually(
+        self, packages: List[str], tracker: Optional[OperationTracker]
+    ) -> Tuple[int, List[str]]:
+        """Install packages one at a time; return (success count, failures)."""
+        success_count = 0
+        failures = []
+        for pkg in packages:
+            if self.installer.install([pkg]):
+                success_count += 1
+                if tracker:
+                    tracker.record_change("installed_package", pkg, status="success")
+                self.progress_tracker.update_progress(f"Installed: {pkg}")
+            else:
+                failures.append(pkg)
+                if tracker:
+                    tracker.record_change("installed_package", pkg, status="failed")
+                self.progress_tracker.update_progress(f"Failed: {pkg}")
+        return success_count, failures
@@ -4,12 +4,45 @@ State management for AutoRig operations with error recovery and rollback capabil
 
 import json
 import os
-from datetime import datetime
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .config import RigConfig
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write data to path as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        # Match orjson, which always writes UTF-8, regardless of the locale
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _read_json(path: Path) -> Any:
+    """Parse the JSON file at path, using orjson when it is installed."""
+    # Both parsers decode the same bytes (json.loads detects UTF-8) instead of
+    # the fallback going through the locale encoding
+    data = path.read_bytes()
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Undoes every recorded change of one action type
+_RollbackHandler = Callable[[List[Dict[str, Any]]], None]
+
 
 class StateManager:
     """
@@ -20,9 +53,18 @@ class StateManager:
         self.config = config
         self.state_dir = Path(os.path.expanduser(state_dir))
         self.state_dir.mkdir(parents=True, exist_ok=True)
-        self.state_file = (
-            self.state_dir / f"{self._sanitize_filename(config.name)}.json"
-        )
+        # The config name never changes, so sanitize it once
+        self._sanitized_name = self._sanitize_filename(config.name)
+        self.state_file = self.state_dir / f"{self._sanitized_name}.json"
+        # Rollback files are named <prefix><timestamp>.json, prefix per operation
+        self._rollback_prefix_tpl = f"{self._sanitized_name}_rollback_%s_"
+        # Rollback handlers by recorded action; each undoes a list of changes
+        self._rollback_handlers: Dict[str, _RollbackHandler] = {
+            "created_symlink": self._undo_symlinks,
+            "modified_file": self._undo_modified_files,
+            "installed_package": self._undo_packages,
+            "git_cloned": self._undo_git_clones,
+        }
 
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize the config name to be a valid filename."""
@@ -41,14 +83,12 @@ class StateManager:
             "data": state_data,
         }
 
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        _write_json(self.state_file, state)
 
     def load_state(self) -> Optional[Dict[str, Any]]:
         """Load the current state if it exists."""
         if self.state_file.exists():
-            with open(self.state_file, "r") as f:
-                return json.load(f)
+            return _read_json(self.state_file)
         return None
 
     def clear_state(self):
@@ -58,9 +98,9 @@ class StateManager:
 
     def create_rollback_point(self, operation: str, changes: List[Dict[str, Any]]):
         """Create a rollback point for an operation."""
+        prefix = self._rollback_prefix_tpl % operation
         rollback_file = (
-            self.state_dir
-            / f"{self._sanitize_filename(self.config.name)}_rollback_{operation}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            self.state_dir / f"{prefix}{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         )
 
         rollback_data = {
@@ -70,69 +110,108 @@ class StateManager:
             "changes": changes,
         }
 
-        with open(rollback_file, "w") as f:
-            json.dump(rollback_data, f, indent=2)
+        _write_json(rollback_file, rollback_data)
 
         return rollback_file
 
     def get_latest_rollback(self, operation: str) -> Optional[Path]:
         """Get the latest rollback file for an operation."""
-        rollback_files = list(
-            self.state_dir.glob(
-                f"{self._sanitize_filename(self.config.name)}_rollback_{operation}_*.json"
-            )
-        )
-        if not rollback_files:
-            return None
-        return sorted(rollback_files, key=lambda x: x.name)[-1]
+        prefix = self._rollback_prefix_tpl % operation
+        # Timestamped names sort chronologically, so the largest is the newest
+        latest: Optional[str] = None
+        with os.scandir(self.state_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.startswith(prefix)
+                    and name.endswith(".json")
+                    and (latest is None or name > latest)
+                ):
+                    latest = name
+        return self.state_dir / latest if latest is not None else None
 
     def rollback_operation(self, rollback_file: Path):
         """Execute rollback based on a rollback file."""
         if not rollback_file.exists():
             raise FileNotFoundError(f"Rollback file not found: {rollback_file}")
 
-        with open(rollback_file, "r") as f:
-            rollback_data = json.load(f)
+        rollback_data = _read_json(rollback_file)
 
         changes = rollback_data.get("changes", [])
         operation = rollback_data.get("operation", "")
 
         print(f"Rolling back operation: {operation}")
 
+        # Group changes by action (in order of first appearance) so each
+        # handler can undo all of its changes in one batch
+        by_action: Dict[str, List[Dict[str, Any]]] = {}
+        for change in changes:
+            by_action.setdefault(change.get("action", ""), []).append(change)
+
+        for action, action_changes in by_action.items():
+            handler = self._rollback_handlers.get(action)
+            if handler is not None:
+                handler(action_changes)
+
+    def _undo_symlinks(self, changes: List[Dict[str, Any]]) -> None:
+        for change in changes:
+            path = change.get("path", "")
+            target_path = Path(os.path.expanduser(path))
+            if target_path.is_symlink():
+                target_path.unlink()
+                print(f"Removed symlink: {path}")
+
+    def _undo_modified_files(self, changes: List[Dict[str, Any]]) -> None:
         for change in changes:
-            action = change.get("action", "")
             path = change.get("path", "")
             previous_state = change.get("previous_state", {})
+            target_path = Path(os.path.expanduser(path))
+            if previous_state.get("exists", False):
+                backup_path = Path(
+                    os.path.expanduser(previous_state.get("backup_path", ""))
+                )
+                if backup_path.exists():
+                    if target_path.exists():
+                        target_path.unlink()
+                    backup_path.rename(target_path)
+                    print(f"Restored file from backup: {path}")
+
+    def _undo_packages(self, changes: List[Dict[str, Any]]) -> None:
+        from .installers.base import get_system_installer
+
+        # Packages whose install failed were never installed, and naming them
+        # would make the whole batch removal fail
+        packages = [
+            change.get("path", "")
+            for change in changes
+            if change.get("status") != "failed"
+        ]
+        if not packages:
+            return
+        for package in packages:
+            print(f"Rolling back package installation: {package}")
 
-            if action == "created_symlink":
-                target_path = Path(os.path.expanduser(path))
-                if target_path.is_symlink():
-                    target_path.unlink()
-                    print(f"Removed symlink: {path}")
-            elif action == "modified_file":
-                target_path = Path(os.path.expanduser(path))
-                if previous_state.get("exists", False):
-                    backup_path = Path(
-                        os.path.expanduser(previous_state.get("backup_path", ""))
-                    )
-                    if backup_path.exists():
-                        if target_path.exists():
-                            target_path.unlink()
-                        backup_path.rename(target_path)
-                        print(f"Restored file from backup: {path}")
-            elif action == "installed_package":
-                from .installers.base import get_system_installer
-
-                installer = get_system_installer()
-                print(f"Rolling back package installation: {path}")
-                installer.uninstall([path])
-            elif action == "git_cloned":
-                repo_path = Path(os.path.expanduser(path))
-                if repo_path.exists():
-                    import shutil
-
-                    shutil.rmtree(repo_path)
-                    print(f"Removed cloned repository: {path}")
+        installer = get_system_installer()
+        # One uninstall call for the whole batch; if the package manager
+        # rejects it, remove packages one by one so the others still go
+        if not installer.uninstall(packages) and len(packages) > 1:
+            for package in packages:
+                installer.uninstall([package])
+
+    def _undo_git_clones(self, changes: List[Dict[str, Any]]) -> None:
+        def remove(path: str) -> None:
+            repo_path = Path(os.path.expanduser(path))
+            if repo_path.exists():
+                shutil.rmtree(repo_path)
+                print(f"Removed cloned repository: {path}")
+
+        paths = [change.get("path", "") for change in changes]
+        if len(paths) == 1:
+            remove(paths[0])
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            # list() re-raises the first removal error, as the loop did
+            list(executor.map(remove, paths))
 
 
 class OperationTracker:
@@ -140,23 +219,44 @@ class OperationTracker:
     Tracks ongoing operations and manages rollbacks.
     """
 
-    def __init__(self, state_manager: StateManager, operation_name: str):
+    def __init__(
+        self,
+        state_manager: StateManager,
+        operation_name: str,
+        timestamp_mode: str = "per_change",
+    ):
+        """
+        With ``timestamp_mode="per_batch"`` changes are not stamped as they
+        are recorded; they all get one timestamp when a rollback point is saved.
+        """
+        if timestamp_mode not in ("per_change", "per_batch"):
+            raise ValueError(f"Unknown timestamp mode: {timestamp_mode}")
         self.state_manager = state_manager
         self.operation_name = operation_name
+        self._stamp_changes = timestamp_mode == "per_change"
         self.changes: List[Dict[str, Any]] = []
 
     def record_change(self, action: str, path: str, **details):
         """Record a change made during an operation."""
-        change = {
-            "action": action,
-            "path": path,
-            "timestamp": datetime.now().isoformat(),
-            **details,
-        }
+        change = {"action": action, "path": path, **details}
+        if self._stamp_changes:
+            change["timestamp"] = datetime.now(timezone.utc).isoformat()
         self.changes.append(change)
 
+    def record_change_many(self, action: str, paths: List[str], **details):
+        """Record the same change for several paths at once."""
+        if self._stamp_changes:
+            details["timestamp"] = datetime.now(timezone.utc).isoformat()
+        self.changes.extend(
+            [{"action": action, "path": path, **details} for path in paths]
+        )
+
     def save_rollback_point(self):
         """Save the current set of changes as a rollback point."""
+        if not self._stamp_changes:
+            timestamp = datetime.now(timezone.utc).isoformat()
+            for change in self.changes:
+                change.setdefault("timestamp", timestamp)
         return self.state_manager.create_rollback_point(
             self.operation_name, self.changes
         )
@@ -7,11 +7,10 @@ from typing import Any, Dict, Optional
 
 import typer
 from rich import box
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-console = Console()
+from ._console import console
 
 
 class TemplateManager:
@@ -1,12 +1,28 @@
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from .utils import get_cache_dir
+
+
+def _bytecode_cache(directory: Optional[Path] = None) -> FileSystemBytecodeCache:
+    """Bytecode cache shared by all runs, so templates compile only once."""
+    if directory is None:
+        directory = get_cache_dir() / "jinja"
+    directory.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(directory))
 
 
 class TemplateRenderer:
-    def __init__(self, search_path: Path):
-        self.env = Environment(loader=FileSystemLoader(str(search_path)))
+    def __init__(self, search_path: Path, cache_dir: Optional[Path] = None):
+        # Templates don't change during a run; skip the per-lookup mtime check
+        self.env = Environment(
+            loader=FileSystemLoader(str(search_path)),
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=_bytecode_cache(cache_dir),
+        )
 
     def render(self, template_name: str, context: Dict[str, Any], output_path: Path):
         template = self.env.get_template(template_name)
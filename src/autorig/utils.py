@@ -1,7 +1,30 @@
 """Common utilities for AutoRig."""
 
+import functools
 import os
 from pathlib import Path
+from typing import Optional, Tuple
+
+# System directories that paths from configuration must not point into
+_DANGEROUS_PREFIXES = (
+    "/etc",
+    "/root",
+    "/boot",
+    "/sys",
+    "/proc",
+    "/dev",
+    "/var/log",
+    "/usr/bin",
+    "/usr/sbin",
+    "/bin",
+    "/sbin",
+)
+
+# Characters that introduce an environment variable (%VAR% is Windows-only)
+_VAR_MARKERS = ("$", "%") if os.name == "nt" else ("$",)
+
+# Environment variables os.path.expanduser reads to find the home directory
+_HOME_VARS = ("USERPROFILE", "HOMEDRIVE", "HOMEPATH") if os.name == "nt" else ("HOME",)
 
 
 def expand_path(path: str) -> Path:
@@ -14,9 +37,16 @@ def expand_path(path: str) -> Path:
     Returns:
         Expanded Path object
     """
-    expanded = os.path.expanduser(path)
-    expanded = os.path.expandvars(expanded)
-    return Path(expanded)
+    if any(marker in path for marker in _VAR_MARKERS):
+        # Depends on arbitrary environment variables, so never cached
+        return Path(os.path.expandvars(os.path.expanduser(path)))
+    return _expand_user_path(path, tuple(map(os.environ.get, _HOME_VARS)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _expand_user_path(path: str, home: Tuple[Optional[str], ...]) -> Path:
+    """Expand ``~`` in path; home is only part of the key so changes are seen."""
+    return Path(os.path.expanduser(path))
 
 
 def validate_path(path: str) -> bool:
@@ -32,27 +62,14 @@ def validate_path(path: str) -> bool:
     if "../" in path or "..\\" in path:
         return False
 
-    dangerous_paths = [
-        "/etc",
-        "/root",
-        "/boot",
-        "/sys",
-        "/proc",
-        "/dev",
-        "/var/log",
-        "/usr/bin",
-        "/usr/sbin",
-        "/bin",
-        "/sbin",
-    ]
-
-    expanded = str(expand_path(path))
-
-    for dangerous in dangerous_paths:
-        if expanded.startswith(dangerous) and expanded != dangerous:
-            return False
-
-    return True
+    # Only the string is needed here, so skip building a Path; normalising
+    # keeps "/./etc" or "/usr//bin" from slipping past the prefix check
+    expanded = os.path.normpath(os.path.expandvars(os.path.expanduser(path)))
+
+    # Anything below a system directory is rejected, the directory itself is not
+    return not (
+        expanded.startswith(_DANGEROUS_PREFIXES) and expanded not in _DANGEROUS_PREFIXES
+    )
 
 
 def safe_open(path: str, mode: str = "r"):
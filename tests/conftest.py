@@ -2,6 +2,9 @@ import os
 import re
 import pytest
 
+# Matches any CSI escape sequence (colours, cursor movement, erase, ...)
+_ANSI_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+
 
 @pytest.fixture(autouse=True)
 def disable_color_env():
@@ -13,6 +16,20 @@ def disable_color_env():
     yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path_factory, monkeypatch):
+    """
+    Point the home directory at a temporary one, so caches, state and other
+    files under ~/.autorig never land in the developer's real home.
+    """
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    # The log directory is resolved when autorig.logger is imported
+    monkeypatch.setattr("autorig.logger._LOG_DIR", home / ".autorig" / "logs")
+    yield home
+
+
 def strip_ansi(s: str) -> str:
     """Optional helper to strip ANSI escape sequences in tests if needed."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+    return _ANSI_RE.sub("", s)
@@ -1,6 +1,6 @@
 import os
 import pytest
-from autorig.config import RigConfig
+from autorig.config import GitRepo, RigConfig
 
 
 @pytest.fixture
@@ -46,3 +46,39 @@ def test_env_var_expansion(tmp_path):
     # Ensure we test against the actual env var
     config = RigConfig.from_yaml(str(p))
     assert config.variables["home"] == os.environ.get("HOME", "")
+
+
+def test_schema_validation_error(tmp_path):
+    """Test that schema violations are reported with the offending value."""
+    p = tmp_path / "bad_rig.yaml"
+    p.write_text("name: bad\nsystem:\n  packages: 3\n")
+
+    with pytest.raises(ValueError, match="3 is not of type 'array'"):
+        RigConfig.from_yaml(str(p))
+
+
+def test_schema_validator_is_built_once():
+    """Test that the schema validator is reused across validations."""
+    from autorig.schema import get_config_validator
+
+    assert get_config_validator() is get_config_validator()
+
+
+def test_git_repo_expanded_path_is_computed_once(monkeypatch, tmp_path):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    repo = GitRepo(url="https://example.com/r.git", path="~/src/r")
+
+    assert repo.expanded_path == tmp_path / "src" / "r"
+    assert repo.expanded_path is repo.expanded_path
+
+
+@pytest.mark.parametrize("path", ["~/src/../etc", "~/src/..", "..\\windows", ".."])
+def test_git_repo_rejects_parent_components(path):
+    with pytest.raises(ValueError, match="Path traversal"):
+        GitRepo(url="https://example.com/r.git", path=path)
+
+
+def test_git_repo_allows_dots_inside_names():
+    repo = GitRepo(url="https://example.com/r.git", path="~/src/notes.../r..b")
+
+    assert repo.path == "~/src/notes.../r..b"
@@ -0,0 +1,132 @@
+import logging
+from unittest.mock import MagicMock
+
+from autorig.config import Dotfile
+from autorig.services.dotfile_service import DotfileService
+
+
+def _service(tmp_path, jobs):
+    config_dir = tmp_path / "rig"
+    config_dir.mkdir()
+    return DotfileService(
+        str(config_dir / "rig.yaml"),
+        renderer=MagicMock(),
+        logger=logging.getLogger("test"),
+        progress_tracker=MagicMock(),
+        jobs=jobs,
+    )
+
+
+def test_link_dotfiles_in_parallel(tmp_path):
+    service = _service(tmp_path, jobs=4)
+    config_dir = tmp_path / "rig"
+    home = tmp_path / "home"
+    dotfiles = []
+    for n in range(8):
+        (config_dir / f"file{n}").write_text(str(n))
+        dotfiles.append(Dotfile(source=f"file{n}", target=str(home / f".file{n}")))
+    tracker = MagicMock()
+
+    service.link_dotfiles(dotfiles, {}, tracker)
+
+    for n in range(8):
+        target = home / f".file{n}"
+        assert target.is_symlink()
+        assert target.read_text() == str(n)
+    assert service.progress_tracker.update_progress.call_count == 8
+    assert tracker.record_change.call_count == 8
+
+
+def test_link_dotfiles_same_target_in_order(tmp_path):
+    service = _service(tmp_path, jobs=4)
+    config_dir = tmp_path / "rig"
+    (config_dir / "first").write_text("first")
+    (config_dir / "second").write_text("second")
+    target = tmp_path / "home" / ".rc"
+
+    service.link_dotfiles(
+        [
+            Dotfile(source="first", target=str(target)),
+            Dotfile(source="second", target=str(target)),
+        ],
+        {},
+    )
+
+    assert target.read_text() == "second"
+
+
+def test_link_dotfiles_groups_equivalent_targets(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    service = _service(tmp_path, jobs=4)
+    config_dir = tmp_path / "rig"
+    (config_dir / "first").write_text("first")
+    (config_dir / "second").write_text("second")
+    target = tmp_path / "home" / ".rc"
+    tracker = MagicMock()
+    # Both entries name the same file, so they form one group and one worker
+    monkeypatch.setattr(
+        "autorig.services.dotfile_service.ThreadPoolExecutor",
+        MagicMock(side_effect=AssertionError("same target linked in parallel")),
+    )
+
+    service.link_dotfiles(
+        [
+            Dotfile(source="first", target="~/.rc"),
+            Dotfile(source="second", target=str(target)),
+        ],
+        {},
+        tracker,
+    )
+
+    assert target.read_text() == "second"
+    assert [c.args[0] for c in tracker.record_change.call_args_list] == [
+        "created_symlink",
+        "backup_file",
+        "created_symlink",
+    ]
+
+
+def test_existing_targets_are_backed_up_or_removed(tmp_path):
+    service = _service(tmp_path, jobs=1)
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / ".file").write_text("old")
+    (home / ".link").symlink_to(home / "missing")
+    tracker = MagicMock()
+
+    service._handle_existing_target(home / ".file", tracker)
+    service._handle_existing_target(home / ".link", tracker)
+    service._handle_existing_target(home / ".absent", tracker)
+
+    # The file was moved to a backup, the dangling symlink just removed
+    (backup,) = home.iterdir()
+    assert backup.name.startswith(".file.") and backup.name.endswith(".bak")
+    assert tracker.record_change.call_count == 2
+
+    service.force = True
+    (home / ".dir").mkdir()
+    service._handle_existing_target(home / ".dir", tracker)
+    assert not (home / ".dir").exists()
+
+
+def test_dry_run_leaves_existing_targets(tmp_path):
+    config_dir = tmp_path / "rig"
+    config_dir.mkdir()
+    (config_dir / "rc").write_text("new")
+    target = tmp_path / "home" / ".rc"
+    target.parent.mkdir()
+    target.write_text("old")
+    service = DotfileService(
+        str(config_dir / "rig.yaml"),
+        renderer=MagicMock(),
+        logger=logging.getLogger("test"),
+        progress_tracker=MagicMock(),
+        dry_run=True,
+    )
+
+    service.link_dotfiles([Dotfile(source="rc", target=str(target))], {})
+    service.force = True
+    service.link_dotfiles([Dotfile(source="rc", target=str(target))], {})
+
+    assert target.read_text() == "old"
+    assert [p.name for p in target.parent.iterdir()] == [".rc"]
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from autorig.services.git_operations import GitOperations, git_executable
+
+
+def test_clone_all_bounds_concurrency(tmp_path):
+    running = 0
+    peak = 0
+    calls = []
+
+    class FakeProcess:
+        returncode = 0
+
+        async def communicate(self):
+            nonlocal running
+            await asyncio.sleep(0.01)
+            running -= 1
+            return b"", b""
+
+    async def fake_exec(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        calls.append((args, kwargs["env"]))
+        return FakeProcess()
+
+    specs = [
+        (f"https://example.com/r{n}.git", tmp_path / f"r{n}", "main") for n in range(6)
+    ]
+    ops = GitOperations(logging.getLogger("test"))
+
+    with (
+        patch("autorig.services.git_operations._pygit2", return_value=None),
+        patch("asyncio.create_subprocess_exec", side_effect=fake_exec),
+    ):
+        results = asyncio.run(ops.clone_all(specs, concurrency=2, shallow=True))
+
+    assert results == [(True, "", "")] * 6
+    assert peak == 2
+    args, env = calls[0]
+    assert args[:6] == (
+        git_executable(),
+        "-c",
+        "protocol.version=2",
+        "clone",
+        "--depth=1",
+        "--filter=blob:none",
+    )
+    assert env["GIT_TERMINAL_PROMPT"] == "0"
+
+
+def test_get_status_uses_pygit2_when_installed(tmp_path):
+    flags = dict(
+        GIT_STATUS_INDEX_NEW=1,
+        GIT_STATUS_INDEX_MODIFIED=2,
+        GIT_STATUS_INDEX_DELETED=4,
+        GIT_STATUS_INDEX_RENAMED=8,
+        GIT_STATUS_INDEX_TYPECHANGE=16,
+        GIT_STATUS_WT_NEW=128,
+        GIT_STATUS_WT_MODIFIED=256,
+        GIT_STATUS_WT_DELETED=512,
+        GIT_STATUS_WT_TYPECHANGE=1024,
+        GIT_STATUS_WT_RENAMED=2048,
+        GIT_STATUS_IGNORED=16384,
+        GIT_STATUS_CONFLICTED=32768,
+    )
+    repo = MagicMock()
+    repo.status.return_value = {
+        "new.txt": 128,
+        "both.txt": 2 | 256,
+        "staged.txt": 1,
+        "ignored.log": 16384,
+    }
+    fake_pygit2 = SimpleNamespace(Repository=lambda path: repo, **flags)
+    ops = GitOperations(logging.getLogger("test"))
+
+    with (
+        patch("autorig.services.git_operations._pygit2", return_value=fake_pygit2),
+        patch("asyncio.create_subprocess_exec") as exec_,
+    ):
+        status = asyncio.run(ops.get_status(tmp_path))
+
+    exec_.assert_not_called()
+    assert status == "MM both.txt\n?? new.txt\nA  staged.txt\n"
+
+
+def test_is_git_repo_accepts_git_dir_and_gitfile(tmp_path):
+    ops = GitOperations(logging.getLogger("test"))
+    (tmp_path / "repo" / ".git").mkdir(parents=True)
+    (tmp_path / "worktree").mkdir()
+    (tmp_path / "worktree" / ".git").write_text("gitdir: ../repo/.git\n")
+
+    assert ops.is_git_repo(tmp_path / "repo")
+    assert ops.is_git_repo(tmp_path / "worktree")
+    assert not ops.is_git_repo(tmp_path)
+
+
+def test_validate_path_resolves_before_checking(monkeypatch):
+    # The isolated test home lives under /tmp, which is itself forbidden
+    monkeypatch.setenv("HOME", "/home/alice")
+    ops = GitOperations(logging.getLogger("test"))
+
+    assert ops.validate_path("~/code/foo..bar")
+    assert ops.validate_path("~/code/../projects/repo")
+    assert not ops.validate_path("/tmp/repo")
+    assert not ops.validate_path("/var/../tmp/repo")
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import os
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from autorig.config import GitRepo
+from autorig.services.git_operations import GIT_FETCH_OPTIONS, git_executable
+from autorig.services.git_service import GitService
+
+
+def _clone_args(tmp_path, **repo_fields):
+    calls = []
+
+    class FakeStream:
+        async def read(self):
+            return b""
+
+    class FakeProcess:
+        stderr = FakeStream()
+
+        async def wait(self):
+            return 0
+
+    async def fake_exec(*args, **kwargs):
+        calls.append(args)
+        return FakeProcess()
+
+    repo = GitRepo(url="https://example.com/r.git", path=str(tmp_path), **repo_fields)
+    service = GitService(logging.getLogger("test"), MagicMock())
+    with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+        asyncio.run(service._clone_repo(repo, tmp_path / "r", None))
+    return calls[0]
+
+
+def test_clone_is_shallow_by_default(tmp_path):
+    args = _clone_args(tmp_path)
+
+    assert args[:7] == (
+        git_executable(),
+        *GIT_FETCH_OPTIONS,
+        "clone",
+        "--depth=1",
+        "--single-branch",
+        "--no-tags",
+    )
+    assert args[7:9] == ("-b", "main")
+
+
+def test_clone_full_history_with_depth_zero(tmp_path):
+    args = _clone_args(tmp_path, depth=0)
+
+    assert args[:6] == (git_executable(), *GIT_FETCH_OPTIONS, "clone", "-b", "main")
+
+
+def test_git_executable_is_absolute():
+    assert os.path.isabs(git_executable())
+
+
+def test_run_git_discards_stdout_unless_verbose(tmp_path, capsys):
+    quiet = GitService(logging.getLogger("test"), MagicMock())
+    verbose = GitService(logging.getLogger("test"), MagicMock(), verbose=True)
+
+    assert asyncio.run(quiet._run_git("--version")) == (0, "")
+    assert "Git output" not in capsys.readouterr().out
+
+    assert asyncio.run(verbose._run_git("--version")) == (0, "")
+    assert "Git output: git version" in capsys.readouterr().out
+
+    returncode, stderr = asyncio.run(quiet._run_git("-C", str(tmp_path), "log"))
+    assert returncode != 0
+    assert "not a git repository" in stderr
+
+
+def test_sync_repos_bounds_concurrency(tmp_path):
+    running = 0
+    peak = 0
+
+    class FakeStream:
+        async def read(self, n=-1):
+            return b""
+
+    class FakeProcess:
+        returncode = 0
+        stdout = FakeStream()
+
+        async def wait(self):
+            nonlocal running
+            await asyncio.sleep(0.01)
+            running -= 1
+            return 0
+
+        async def communicate(self):
+            await self.wait()
+            return b"", b""
+
+    async def fake_exec(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        return FakeProcess()
+
+    repos = []
+    for n in range(6):
+        (tmp_path / f"r{n}" / ".git").mkdir(parents=True)
+        repos.append(
+            GitRepo(url="https://example.com/r.git", path=str(tmp_path / f"r{n}"))
+        )
+    service = GitService(logging.getLogger("test"), MagicMock(), concurrency=2)
+
+    with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+        asyncio.run(service.sync_repos(repos))
+
+    assert peak == 2
+
+
+def test_sync_repos_warns_about_uncommitted_changes(tmp_path, capsys):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / "notes.txt").write_text("draft")
+    repo = GitRepo(url="https://example.com/r.git", path=str(tmp_path))
+    service = GitService(logging.getLogger("test"), MagicMock())
+
+    asyncio.run(service.sync_repos([repo]))
+
+    output = " ".join(capsys.readouterr().out.split())
+    assert "has uncommitted changes" in output
+
+
+def test_process_repositories_handles_every_repo(tmp_path):
+    repos = [
+        GitRepo(url="https://example.com/r.git", path=str(tmp_path / f"r{n}"))
+        for n in range(3)
+    ]
+    service = GitService(logging.getLogger("test"), MagicMock(), concurrency=2)
+    seen = []
+
+    async def fake_clone_or_update(repo, index, total, tracker):
+        await asyncio.sleep(0)
+        seen.append((index, total))
+
+    with patch.object(service, "_clone_or_update_repo", fake_clone_or_update):
+        asyncio.run(service.process_repositories(repos))
+
+    assert sorted(seen) == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_run_git_replaces_undecodable_stderr():
+    class FakeStream:
+        async def read(self):
+            return b"fatal: \xff bad"
+
+    class FakeProcess:
+        stderr = FakeStream()
+
+        async def wait(self):
+            return 128
+
+    async def fake_exec(*args, **kwargs):
+        return FakeProcess()
+
+    service = GitService(logging.getLogger("test"), MagicMock())
+    with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+        assert asyncio.run(service._run_git("fetch")) == (128, "fatal: � bad")
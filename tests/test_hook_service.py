@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import subprocess
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autorig.config import Script
+from autorig.services.hook_service import HookService
+
+
+@pytest.fixture
+def service():
+    return HookService(logging.getLogger("test"), MagicMock())
+
+
+@pytest.mark.parametrize(
+    "command",
+    ["echo hello", "ls -la ~/projects", "git status", "make install"],
+)
+def test_safe_commands_allowed(service, command):
+    assert service._is_safe_command(command)
+
+
+@pytest.mark.parametrize(
+    "command, pattern",
+    [
+        ("echo hi; ls", ";"),
+        ("true || reboot", "||"),
+        ("echo $(( 1+1))", "$(( "),
+        ("echo `whoami`", r"`"),
+        ("echo $(whoami)", r"\$\(.*\)"),
+        ("Python3 -C 'print(1)'", r"python.*-c"),
+        ("RM -RF build", r"rm\s+-rf"),
+        ("mv /opt/app /usr", r"mv\s+/.*\s+/"),
+    ],
+)
+def test_dangerous_pattern_blocked_and_reported(service, caplog, command, pattern):
+    with caplog.at_level(logging.WARNING, logger="test"):
+        assert not service._is_safe_command(command)
+
+    assert caplog.records[-1].getMessage() == (
+        f"Blocked command with dangerous pattern: {pattern}"
+    )
+
+
+def test_dangerous_path_blocked(service):
+    assert not service._is_safe_command("cat '/etc/passwd'")
+
+
+@pytest.mark.parametrize(
+    "command, args",
+    [
+        ("make build", ["make", "build"]),
+        (
+            "pip install  --user black==24.1",
+            ["pip", "install", "--user", "black==24.1"],
+        ),
+        ("echo 'hello world'", ["echo", "hello world"]),
+        ('git commit -m "a b"', ["git", "commit", "-m", "a b"]),
+    ],
+)
+def test_run_command_safely_splits_arguments(service, command, args):
+    with patch("subprocess.run") as run:
+        service._run_command_safely(command)
+
+    assert run.call_args.args[0] == args
+    assert run.call_args.kwargs["shell"] is False
+
+
+def test_run_command_safely_uses_shell_for_metachars(service):
+    with patch("subprocess.run") as run:
+        service._run_command_safely("ls > files.txt")
+
+    assert run.call_args.args[0] == "ls > files.txt"
+    assert run.call_args.kwargs["shell"] is True
+
+
+def test_run_scripts_async_runs_parallel_groups_concurrently(service):
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    order = []
+
+    def fake_run(command, cwd=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+            order.append(command)
+        return subprocess.CompletedProcess(command, 0, stdout="")
+
+    scripts = [Script(command="echo first")]
+    scripts += [Script(command=f"echo p{n}", parallel=True) for n in range(3)]
+    scripts += [Script(command="echo last")]
+    tracker = MagicMock()
+
+    with patch.object(service, "_run_command_safely", side_effect=fake_run):
+        asyncio.run(service.run_scripts_async(scripts, tracker, max_parallel=2))
+
+    assert peak == 2
+    assert order[0] == "echo first"
+    assert order[-1] == "echo last"
+    assert tracker.record_change.call_count == 5
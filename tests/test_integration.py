@@ -60,7 +60,7 @@ def test_full_integration():
         assert rig.config.name == "Test Integration Config"
 
 
-@patch("autorig.profiles.EnvironmentDetector._collect_environment_info")
+@patch("autorig.profiles._collect_environment_info")
 @patch("subprocess.run")
 def test_autorig_with_new_features(mock_subprocess, mock_env_info):
     """Test AutoRig with mocked subprocess for new features."""
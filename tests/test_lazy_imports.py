@@ -0,0 +1,36 @@
+import json
+import subprocess
+import sys
+
+from autorig.lazy_imports import LazyDict, LazyLoader
+
+
+def test_lazy_loader_defers_import_and_caches_attributes():
+    loader = LazyLoader("json")
+    assert loader._module is None
+
+    assert loader.dumps({"a": 1}) == '{"a": 1}'
+    assert loader._module is json
+    assert loader.__dict__["dumps"] is json.dumps
+    assert loader.__name__ == "json"
+
+
+def test_lazy_dict_runs_loader_once():
+    calls = []
+    data = LazyDict(plain=1)
+    data.add_lazy_loader("lazy", lambda: calls.append(1) or "value")
+
+    assert data["plain"] == 1
+    assert data["lazy"] == "value"
+    assert data["lazy"] == "value"
+    assert calls == [1]
+
+
+def test_cli_import_does_not_load_templates():
+    # The built-in template catalogue is only needed by the template commands
+    code = "import sys, autorig.cli; print('autorig.templates' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
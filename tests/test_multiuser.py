@@ -0,0 +1,92 @@
+import os
+
+import pytest
+
+from autorig import multiuser
+from autorig.multiuser import MultiUserManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USER", "alice")
+    return MultiUserManager(str(tmp_path / "rig.yaml"))
+
+
+def test_current_username_resolved_at_init(manager, monkeypatch):
+    monkeypatch.setenv("USER", "bob")
+    assert manager.get_current_username() == "alice"
+
+
+def test_user_config_path(manager):
+    assert manager.get_user_config_path() == manager.user_config_dir / "alice.yaml"
+    assert manager.get_user_config_path("bob") == manager.user_config_dir / "bob.yaml"
+
+
+def test_shared_config_roundtrip(manager):
+    data = {"name": "team", "system": {"packages": ["git", "curl"]}}
+    manager.save_shared_config("team", data)
+
+    assert manager.get_shared_config("team") == data
+    assert manager.get_shared_config("missing") is None
+
+
+def test_save_shared_config_leaves_no_temp_file(manager):
+    manager.save_shared_config("team", {"name": "team"})
+
+    assert sorted(p.name for p in manager.shared_config_dir.iterdir()) == ["team.yaml"]
+
+
+def test_lock_is_exclusive_until_released(manager, tmp_path):
+    other = MultiUserManager(str(tmp_path / "rig.yaml"))
+
+    assert manager.acquire_lock("team")
+    assert not other.acquire_lock("team")
+
+    manager.release_lock("team")
+    assert other.acquire_lock("team")
+    other.release_lock("team")
+
+
+def test_apply_config_for_user_reuses_unchanged_config(manager, tmp_path, monkeypatch):
+    monkeypatch.setattr(multiuser, "_CONFIG_CACHE", {})
+    config_path = tmp_path / "rig.yaml"
+    config_path.write_text("name: base\n")
+
+    first = manager.apply_config_for_user(str(config_path))
+    assert manager.apply_config_for_user(str(config_path)) is first
+
+    mtime_ns = config_path.stat().st_mtime_ns
+    config_path.write_text("name: changed\n")
+    os.utime(config_path, ns=(mtime_ns, mtime_ns + 1_000_000))
+    assert manager.apply_config_for_user(str(config_path)).name == "changed"
+    # The stale parse is replaced, not kept alongside the new one
+    assert list(multiuser._CONFIG_CACHE) == [str(config_path)]
+
+
+def test_merge_configs_is_deep_and_leaves_base_untouched(manager):
+    base = {"name": "base", "variables": {"a": 1, "nested": {"x": 1, "y": 2}}}
+    override = {"variables": {"b": 2, "nested": {"y": 3}}}
+
+    merged = manager._merge_configs(base, override)
+
+    assert merged == {
+        "name": "base",
+        "variables": {"a": 1, "b": 2, "nested": {"x": 1, "y": 3}},
+    }
+    assert base["variables"]["nested"] == {"x": 1, "y": 2}
+
+
+def test_list_configs(manager):
+    manager.save_shared_config("team", {"name": "team"})
+    (manager.shared_config_dir / "notes.txt").write_text("ignored")
+    (manager.user_config_dir / "alice.yaml").write_text("name: alice\n")
+
+    assert manager.list_shared_configs() == {
+        "team": manager.shared_config_dir / "team.yaml"
+    }
+    assert manager.list_user_configs() == {
+        "alice": manager.user_config_dir / "alice.yaml"
+    }
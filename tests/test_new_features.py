@@ -5,9 +5,16 @@ Tests for AutoRig - testing new functionality
 import pytest
 import tempfile
 import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from autorig.config import RigConfig, Hooks
-from autorig.remote import RemoteConfigManager, resolve_config_path
+from autorig.remote import (
+    REMOTE_FETCH_TIMEOUT,
+    RemoteConfigManager,
+    _fetch_remote_config,
+    resolve_config_path,
+)
 from autorig.notifications import NotificationManager, ProgressTracker
 from autorig.state import StateManager, OperationTracker
 from autorig.monitoring import StatusReporter, ResourceMonitor
@@ -153,6 +160,13 @@ class TestMonitoring:
         assert usage.disk_percent >= 0
 
 
+def _response(status_code, body=b"", headers=None):
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.__enter__.return_value = response
+    response.iter_content.return_value = [body[:4], body[4:]]
+    return response
+
+
 class TestRemote:
     """Test the remote configuration functionality."""
 
@@ -160,6 +174,7 @@ class TestRemote:
         """Test the is_remote_url function."""
         assert RemoteConfigManager.is_remote_url("https://example.com/config.yaml")
         assert RemoteConfigManager.is_remote_url("http://example.com/config.yaml")
+        assert RemoteConfigManager.is_remote_url("HTTPS://example.com/config.yaml")
         assert not RemoteConfigManager.is_remote_url("./config.yaml")
         assert not RemoteConfigManager.is_remote_url("~/config.yaml")
 
@@ -174,6 +189,79 @@ class TestRemote:
         finally:
             os.unlink(local_path)
 
+    def test_fetch_remote_config_revalidates_cached_download(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that a cached download is reused when the server returns 304."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        _fetch_remote_config.cache_clear()
+        url = "https://example.com/configs/rig.yaml"
+
+        fresh = _response(200, b"name: remote\n", {"ETag": '"v1"'})
+        not_modified = _response(304)
+
+        with patch("autorig.remote._session.get", return_value=fresh) as get:
+            first = RemoteConfigManager.fetch_remote_config(url)
+        assert first.name == "rig.yaml"
+        assert first.read_bytes() == b"name: remote\n"
+        get.assert_called_once_with(
+            url, headers={}, stream=True, timeout=REMOTE_FETCH_TIMEOUT
+        )
+
+        # A new process revalidates the cached download
+        _fetch_remote_config.cache_clear()
+        with patch("autorig.remote._session.get", return_value=not_modified) as get:
+            assert RemoteConfigManager.fetch_remote_config(url) == first
+        get.assert_called_once_with(
+            url,
+            headers={"If-None-Match": '"v1"'},
+            stream=True,
+            timeout=REMOTE_FETCH_TIMEOUT,
+        )
+
+    def test_fetch_remote_config_async(self, tmp_path, monkeypatch):
+        """Test that several remote configs can be fetched concurrently."""
+        import asyncio
+
+        from autorig.remote import fetch_remote_config_async
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        _fetch_remote_config.cache_clear()
+        urls = ["https://example.com/a.yaml", "https://example.com/b.yaml"]
+
+        async def fetch_all():
+            return await asyncio.gather(*map(fetch_remote_config_async, urls))
+
+        with patch(
+            "autorig.remote._session.get",
+            side_effect=lambda url, **kwargs: _response(200, url.encode()),
+        ):
+            paths = asyncio.run(fetch_all())
+
+        assert [p.name for p in paths] == ["a.yaml", "b.yaml"]
+        assert [p.read_bytes() for p in paths] == [u.encode() for u in urls]
+
+    def test_remote_session_headers(self):
+        """Test that remote fetches identify AutoRig and accept compression."""
+        from autorig import __version__
+        from autorig.remote import _session
+
+        assert _session.headers["User-Agent"] == f"autorig/{__version__}"
+        assert "gzip" in _session.headers["Accept-Encoding"]
+
+    def test_fetch_remote_config_once_per_process(self, tmp_path, monkeypatch):
+        """Test that repeated fetches of a URL reuse the first download."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        _fetch_remote_config.cache_clear()
+        url = "https://example.com/rig.yaml"
+
+        response = _response(200, b"name: remote\n")
+        with patch("autorig.remote._session.get", return_value=response) as get:
+            local_path = resolve_config_path(url)
+            assert resolve_config_path(url) == local_path
+            assert RemoteConfigManager.fetch_remote_config(url) == Path(local_path)
+        get.assert_called_once()
+
 
 class TestCoreEnhancements:
     """Test enhancements to the core functionality."""
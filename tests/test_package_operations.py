@@ -0,0 +1,105 @@
+import logging
+import subprocess
+from unittest.mock import MagicMock, patch
+
+from autorig.services.package_operations import PackageOperations
+
+
+def test_get_package_manager_uses_first_on_path():
+    ops = PackageOperations(logging.getLogger("test"))
+    found = {"pacman", "brew"}
+
+    def fake_which(name):
+        return f"/usr/bin/{name}" if name in found else None
+
+    with (
+        patch("shutil.which", side_effect=fake_which) as which,
+        patch("subprocess.run") as run,
+    ):
+        assert ops.get_package_manager() == "pacman"
+
+    run.assert_not_called()
+    assert [c.args[0] for c in which.call_args_list] == ["apt", "dnf", "yum", "pacman"]
+
+
+def test_get_package_manager_unknown():
+    ops = PackageOperations(logging.getLogger("test"))
+
+    with patch("shutil.which", return_value=None):
+        assert ops.get_package_manager() == "unknown"
+
+
+def test_get_package_manager_is_detected_once():
+    ops = PackageOperations(logging.getLogger("test"), dry_run=True)
+
+    with patch("shutil.which", return_value="/usr/bin/apt") as which:
+        for package in ("git", "curl", "vim"):
+            assert ops.install_package(package) == (True, "")
+        ops.get_package_manager()
+
+    which.assert_called_once_with("apt")
+
+
+def test_install_packages_uses_one_command():
+    ops = PackageOperations(logging.getLogger("test"))
+
+    with patch("subprocess.run") as run:
+        assert ops.install_packages(["git", "curl", "vim"], "apt") == (True, "")
+
+    run.assert_called_once()
+    assert run.call_args.args[0] == [
+        "sudo",
+        "apt-get",
+        "install",
+        "-y",
+        "git",
+        "curl",
+        "vim",
+    ]
+    assert run.call_args.kwargs["stdout"] == subprocess.DEVNULL
+    assert run.call_args.kwargs["stderr"] == subprocess.PIPE
+
+
+def test_install_packages_one_at_a_time_for_winget():
+    ops = PackageOperations(logging.getLogger("test"))
+
+    with patch("subprocess.run") as run:
+        assert ops.install_packages(["Git.Git", "Vim.Vim"], "winget") == (True, "")
+
+    assert [c.args[0] for c in run.call_args_list] == [
+        ["winget", "install", "Git.Git"],
+        ["winget", "install", "Vim.Vim"],
+    ]
+
+
+def test_is_installed_queries_package_database_once():
+    ops = PackageOperations(logging.getLogger("test"))
+    ops._package_manager = "apt"
+    listing = MagicMock(returncode=0, stdout="ii  git\nii  libssl-dev\nrc  vim\n")
+
+    with patch("subprocess.run", return_value=listing) as run:
+        assert ops.is_installed("libssl-dev")
+        assert not ops.is_installed("vim")
+
+    run.assert_called_once()
+    assert run.call_args.args[0][0] == "dpkg-query"
+
+    with patch("subprocess.run", return_value=listing) as run:
+        ops.install_package("vim")
+        ops.is_installed("vim")
+
+    assert run.call_count == 2
+
+
+def test_is_installed_falls_back_to_path_lookup():
+    ops = PackageOperations(logging.getLogger("test"))
+    ops._package_manager = "winget"
+
+    with (
+        patch("shutil.which", return_value="C:/bin/git.exe") as which,
+        patch("subprocess.run") as run,
+    ):
+        assert ops.is_installed("git")
+
+    which.assert_called_once_with("git")
+    run.assert_not_called()
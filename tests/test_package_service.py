@@ -0,0 +1,57 @@
+import logging
+from unittest.mock import MagicMock
+
+from autorig.services.package_service import PackageService
+
+
+def _service(install_results):
+    installer = MagicMock()
+    installer.install.side_effect = install_results
+    return PackageService(installer, logging.getLogger("test"), MagicMock())
+
+
+def test_install_packages_in_one_batch():
+    service = _service([True])
+    tracker = MagicMock()
+
+    service.install_packages(["git", "curl", "vim"], tracker)
+
+    service.installer.install.assert_called_once_with(["git", "curl", "vim"])
+    assert tracker.record_change.call_count == 3
+    assert service.progress_tracker.update_progress.call_count == 3
+
+
+def test_failed_batch_retries_packages_individually():
+    service = _service([False, True, False, True])
+    tracker = MagicMock()
+
+    service.install_packages(["git", "nope", "vim"], tracker)
+
+    assert [c.args[0] for c in service.installer.install.call_args_list] == [
+        ["git", "nope", "vim"],
+        ["git"],
+        ["nope"],
+        ["vim"],
+    ]
+    statuses = {
+        c.args[1]: c.kwargs["status"] for c in tracker.record_change.call_args_list
+    }
+    assert statuses == {"git": "success", "nope": "failed", "vim": "success"}
+
+
+def test_dry_run_reports_progress_once():
+    installer = MagicMock()
+    service = PackageService(
+        installer, logging.getLogger("test"), MagicMock(), dry_run=True
+    )
+    tracker = MagicMock()
+
+    service.install_packages(["git", "curl", "vim"], tracker)
+
+    installer.install.assert_not_called()
+    tracker.record_change_many.assert_called_once_with(
+        "would_install_package", ["git", "curl", "vim"]
+    )
+    service.progress_tracker.update_progress.assert_called_once_with(
+        "Dry run: 3 packages", steps=3
+    )
@@ -0,0 +1,110 @@
+import warnings
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autorig.config import RigConfig
+from autorig.plugins import Plugin, PluginManager, _entry_points_by_group
+
+
+class EchoPlugin(Plugin):
+    name = "echo"
+
+    def apply(self, config, dry_run=False, verbose=False) -> bool:
+        return dry_run
+
+
+def _entry_point(name, plugin_class):
+    entry_point = MagicMock()
+    entry_point.name = name
+    entry_point.load.return_value = plugin_class
+    return entry_point
+
+
+def test_load_entry_points_registers_plugin_classes():
+    manager = PluginManager()
+    with patch(
+        "autorig.plugins._entry_points_by_group",
+        return_value={
+            "autorig.plugins": (
+                _entry_point("echo", EchoPlugin),
+                _entry_point("bad", object),
+            )
+        },
+    ):
+        manager.load_entry_points()
+
+    assert manager.get_available_plugins() == ["echo"]
+
+
+def test_run_plugin():
+    manager = PluginManager()
+    manager.register(EchoPlugin())
+    config = RigConfig(name="test")
+
+    assert manager.run_plugin("echo", config, dry_run=True) is True
+
+
+def test_entry_point_loaded_once_across_managers():
+    entry_point = _entry_point("echo-once", EchoPlugin)
+    entry_point.group, entry_point.value = "autorig.plugins", "tests:EchoOnce"
+
+    for _ in range(2):
+        with patch(
+            "autorig.plugins._entry_points_by_group",
+            return_value={"autorig.plugins": (entry_point,)},
+        ):
+            PluginManager().load_entry_points()
+
+    entry_point.load.assert_called_once()
+
+
+def test_run_unknown_plugin_raises():
+    manager = PluginManager()
+    manager.register(EchoPlugin())
+
+    with pytest.raises(ValueError, match="Plugin 'missing' not found"):
+        manager.run_plugin("missing", RigConfig(name="test"))
+
+
+def test_register_from_module_skips_imported_plugins(tmp_path, monkeypatch):
+    (tmp_path / "sample_plugins.py").write_text(
+        "from autorig.plugins import DotfilePlugin, Plugin\n"
+        "\n"
+        "class SamplePlugin(Plugin):\n"
+        "    name = 'sample'\n"
+        "\n"
+        "    def apply(self, config, dry_run=False, verbose=False):\n"
+        "        return True\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    manager = PluginManager()
+    manager.register_from_module("sample_plugins")
+
+    assert manager.get_available_plugins() == ["sample"]
+
+
+def test_run_all_plugins_logs_failures(caplog):
+    class BrokenPlugin(EchoPlugin):
+        def apply(self, config, dry_run=False, verbose=False) -> bool:
+            raise RuntimeError("boom")
+
+    manager = PluginManager()
+    manager.register(BrokenPlugin())
+    manager.run_all_plugins(RigConfig(name="test"))
+
+    assert "Plugin echo failed: boom" in caplog.text
+
+
+def test_entry_point_scan_uses_no_deprecated_interface():
+    _entry_points_by_group.cache_clear()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        by_group = _entry_points_by_group()
+
+    assert all(
+        entry_point.group == group
+        for group, entry_points in by_group.items()
+        for entry_point in entry_points
+    )
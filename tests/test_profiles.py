@@ -0,0 +1,183 @@
+from unittest.mock import mock_open, patch
+
+from autorig.profiles import (
+    EnvironmentDetector,
+    _deep_merge,
+    _read_dpkg_status,
+    _read_config_file,
+    compile_profile,
+    load_profile_config,
+)
+from autorig.utils import get_cache_dir
+
+
+def test_expensive_environment_info_is_lazy():
+    with patch("autorig.profiles.EnvironmentDetector._get_installed_packages") as pkgs:
+        pkgs.return_value = ["git"]
+        detector = EnvironmentDetector(use_cache=False)
+
+        detector.get_profile_name()
+        detector.matches_profile({"os": detector.env_info["os"]})
+        pkgs.assert_not_called()
+
+        assert "packages_installed" in detector.env_info
+        assert detector.env_info["packages_installed"] == ["git"]
+        assert detector.env_info.get("packages_installed") == ["git"]
+        pkgs.assert_called_once()
+
+
+def test_uncached_detector_leaves_shared_cache_alone():
+    shared = EnvironmentDetector().env_info
+
+    fresh = EnvironmentDetector(use_cache=False).env_info
+
+    assert fresh is not shared
+    assert EnvironmentDetector().env_info is shared
+
+
+def test_load_profile_config_reuses_parse_until_env_changes(tmp_path, monkeypatch):
+    config_path = tmp_path / "rig.yaml"
+    config_path.write_text("name: $RIG_NAME\n")
+    monkeypatch.setenv("RIG_NAME", "first")
+
+    with patch("autorig.profiles._read_config_file", wraps=_read_config_file) as read:
+        assert load_profile_config(str(config_path), "none")["name"] == "first"
+        load_profile_config(str(config_path), "none")["name"] = "mutated"
+        assert load_profile_config(str(config_path), "none")["name"] == "first"
+        assert read.call_count == 1
+
+        monkeypatch.setenv("RIG_NAME", "second")
+        assert load_profile_config(str(config_path), "none")["name"] == "second"
+        assert read.call_count == 2
+
+
+def test_load_profile_config_reuses_sidecar_across_processes(tmp_path, monkeypatch):
+    config_path = tmp_path / "rig.yaml"
+    config_path.write_text("name: plain\n")
+
+    assert load_profile_config(str(config_path), "none")["name"] == "plain"
+
+    # A fresh process starts with an empty in-memory cache
+    monkeypatch.setattr("autorig.profiles._yaml_cache", {})
+    with patch("autorig.profiles._read_config_file", wraps=_read_config_file) as read:
+        assert load_profile_config(str(config_path), "none")["name"] == "plain"
+        read.assert_not_called()
+
+
+def test_deep_merge_does_not_modify_inputs():
+    base = {"name": "base", "system": {"packages": ["git"], "extra": {"a": 1}}}
+    override = {"system": {"extra": {"b": 2}}, "variables": {"x": 1}}
+
+    merged = _deep_merge(base, override)
+
+    assert merged == {
+        "name": "base",
+        "system": {"packages": ["git"], "extra": {"a": 1, "b": 2}},
+        "variables": {"x": 1},
+    }
+    assert base["system"]["extra"] == {"a": 1}
+
+
+def test_load_profile_config_applies_profile_and_local_overrides(tmp_path):
+    config_dir = tmp_path / "configs.yaml.d"
+    config_dir.mkdir()
+    (config_dir / "rig.yaml").write_text("name: base\nvariables: {a: 1}\n")
+    (config_dir / "rig-work.yaml").write_text("variables: {b: 2}\n")
+    (config_dir / "rig.local.yaml").write_text("variables: {a: 3}\n")
+
+    data = load_profile_config(str(config_dir / "rig.yaml"), "work")
+
+    assert data == {"name": "base", "variables": {"a": 3, "b": 2}}
+
+
+def test_matches_profile():
+    detector = EnvironmentDetector()
+    env = detector.env_info
+
+    assert detector.matches_profile({"os": env["os"], "machine": env["machine"]})
+    assert not detector.matches_profile({"os": "not-an-os"})
+    assert not detector.matches_profile({"hostname": None})
+    assert detector.matches_many([{"os": env["os"]}, {"machine": "z80"}]) == [
+        True,
+        False,
+    ]
+
+
+def test_compile_profile_evaluates_many_environments(monkeypatch):
+    monkeypatch.setenv("RIG_TEAM", "infra")
+    matches = compile_profile(
+        {"os": "linux", "shell": "zsh", "conditions": ["is_wsl", "env:RIG_TEAM=infra"]}
+    )
+
+    base = {"os": "linux", "shell": "/usr/bin/zsh", "is_wsl": True}
+    assert matches(base)
+    assert not matches({**base, "os": "darwin"})
+    assert not matches({**base, "shell": "/bin/bash"})
+    assert not matches({**base, "is_wsl": False})
+    assert compile_profile({})({})
+
+
+def test_read_dpkg_status(tmp_path):
+    status = tmp_path / "status"
+    status.write_text(
+        "Package: git\nStatus: install ok installed\nVersion: 1\n\n"
+        "Package: old-tool\nStatus: deinstall ok config-files\n\n"
+        "Package: curl\nStatus: install ok installed\n"
+    )
+
+    assert _read_dpkg_status(str(status)) == ["git", "curl"]
+
+
+def test_get_profile_name_classifies_hostname():
+    detector = EnvironmentDetector()
+    base = f"{detector.env_info['os']}-{detector.env_info['machine']}"
+
+    detector.env_info = dict(detector.env_info, node="Work-ThinkPad-Desktop")
+    assert detector.get_profile_name() == f"{base}-laptop"
+
+    detector.env_info = dict(detector.env_info, node="big-TOWER")
+    assert detector.get_profile_name() == f"{base}-desktop"
+
+
+def test_load_profile_config_merges_only_active_profile(tmp_path):
+    config_path = tmp_path / "rig.yaml"
+    config_path.write_text(
+        "name: base\n"
+        "system: {packages: [git]}\n"
+        "profiles:\n"
+        "  work: {system: {packages: [docker]}}\n"
+        "  home: {system: {packages: [steam]}}\n"
+    )
+
+    data = load_profile_config(str(config_path), "work")
+
+    assert data["system"] == {"packages": ["docker"]}
+    assert set(data["profiles"]) == {"work", "home"}
+
+
+def test_is_vm_falls_back_to_systemd_detect_virt():
+    with (
+        patch("builtins.open", mock_open(read_data="Virtual Machine\n")),
+        patch("autorig.profiles.subprocess.run") as run,
+    ):
+        run.return_value.stdout = "microsoft\n"
+        assert EnvironmentDetector._is_vm() is True
+    run.assert_called_once()
+
+    with (
+        patch("builtins.open", mock_open(read_data="VirtualBox\n")),
+        patch("autorig.profiles.subprocess.run") as run,
+    ):
+        assert EnvironmentDetector._is_vm() is True
+    run.assert_not_called()
+
+
+def test_sidecars_are_pruned_beyond_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr("autorig.profiles.SIDECAR_LIMIT", 2)
+    for n in range(4):
+        config_path = tmp_path / f"rig{n}.yaml"
+        config_path.write_text(f"name: rig{n}\n")
+        load_profile_config(str(config_path), "none")
+
+    sidecars = list((get_cache_dir() / "configs").glob("*.pkl"))
+    assert len(sidecars) == 2
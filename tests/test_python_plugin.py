@@ -0,0 +1,52 @@
+import os
+from unittest.mock import patch
+
+from autorig.python_plugin import _clone_venv, _pip_install_command
+
+
+def test_clone_venv_relocates_scripts_without_touching_template(tmp_path):
+    template = tmp_path / "template"
+    (template / "bin").mkdir(parents=True)
+    (template / "lib").mkdir()
+    (template / "lib" / "module.py").write_text("x = 1\n")
+    pip = template / "bin" / "pip"
+    pip.write_text(f"#!{template}/bin/python\n")
+    pip.chmod(0o755)
+    (template / "bin" / "activate").write_text(f'VIRTUAL_ENV="{template}"\n')
+
+    venv_path = tmp_path / "project" / ".venv"
+    _clone_venv(template, venv_path)
+
+    assert (venv_path / "bin" / "pip").read_text() == f"#!{venv_path}/bin/python\n"
+    assert os.access(venv_path / "bin" / "pip", os.X_OK)
+    assert (venv_path / "bin" / "activate").read_text() == (
+        f'VIRTUAL_ENV="{venv_path}"\n'
+    )
+    assert pip.read_text() == f"#!{template}/bin/python\n"
+    assert os.path.samefile(
+        template / "lib" / "module.py", venv_path / "lib" / "module.py"
+    )
+
+
+def test_pip_install_command_batches_packages():
+    with patch("shutil.which", return_value=None):
+        assert _pip_install_command("py", ["black", "pytest"]) == [
+            "py",
+            "-m",
+            "pip",
+            "install",
+            "--prefer-binary",
+            "--no-input",
+            "black",
+            "pytest",
+        ]
+
+    with patch("shutil.which", return_value="/usr/bin/uv"):
+        assert _pip_install_command("py", ["black"]) == [
+            "/usr/bin/uv",
+            "pip",
+            "install",
+            "--python",
+            "py",
+            "black",
+        ]
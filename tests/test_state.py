@@ -0,0 +1,191 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from autorig.config import RigConfig
+from autorig.state import OperationTracker, StateManager
+
+
+def _manager(tmp_path, name="My Rig!"):
+    return StateManager(RigConfig(name=name), state_dir=str(tmp_path))
+
+
+def test_state_file_uses_sanitized_name(tmp_path):
+    manager = _manager(tmp_path)
+
+    assert manager.state_file == tmp_path / "My_Rig.json"
+
+
+def test_rollback_files_use_sanitized_name(tmp_path):
+    manager = _manager(tmp_path)
+
+    rollback_file = manager.create_rollback_point("apply", [])
+
+    assert rollback_file.name.startswith("My_Rig_rollback_apply_")
+    assert manager.get_latest_rollback("apply") == rollback_file
+
+
+def test_get_latest_rollback_picks_newest(tmp_path):
+    manager = _manager(tmp_path)
+    for stamp in ("20240102_000000", "20241231_235959", "20240701_120000"):
+        (tmp_path / f"My_Rig_rollback_apply_{stamp}.json").write_text("{}")
+    (tmp_path / "My_Rig_rollback_sync_20250101_000000.json").write_text("{}")
+
+    latest = manager.get_latest_rollback("apply")
+
+    assert latest == tmp_path / "My_Rig_rollback_apply_20241231_235959.json"
+    assert manager.get_latest_rollback("missing") is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_state_roundtrip(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("autorig.state.orjson", None)
+    manager = _manager(tmp_path)
+
+    manager.save_state("apply", {"packages": ["git"], "count": 1, "note": "héllo ✓"})
+
+    state = manager.load_state()
+    assert state["operation"] == "apply"
+    assert state["data"] == {"packages": ["git"], "count": 1, "note": "héllo ✓"}
+    assert json.loads(manager.state_file.read_bytes()) == state
+
+
+def test_state_written_by_orjson_loads_without_it(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    manager = _manager(tmp_path)
+    manager.save_state("apply", {"note": "héllo ✓"})
+
+    monkeypatch.setattr("autorig.state.orjson", None)
+
+    assert manager.load_state()["data"] == {"note": "héllo ✓"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_state_rejects_invalid_json(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("autorig.state.orjson", None)
+    manager = _manager(tmp_path)
+    manager.state_file.write_text("{not json")
+
+    with pytest.raises(json.JSONDecodeError):
+        manager.load_state()
+
+
+def test_operation_tracker_stamps_each_change(tmp_path):
+    tracker = OperationTracker(_manager(tmp_path), "apply")
+
+    tracker.record_change("installed_package", "git", status="success")
+
+    change = tracker.changes[0]
+    assert change["status"] == "success"
+    assert datetime.fromisoformat(change["timestamp"]).tzinfo is not None
+
+
+def test_operation_tracker_per_batch_timestamps(tmp_path):
+    tracker = OperationTracker(_manager(tmp_path), "apply", timestamp_mode="per_batch")
+    tracker.record_change("installed_package", "git")
+    tracker.record_change("installed_package", "vim")
+    assert "timestamp" not in tracker.changes[0]
+
+    rollback_file = tracker.save_rollback_point()
+
+    changes = json.loads(rollback_file.read_text())["changes"]
+    assert {c["path"] for c in changes} == {"git", "vim"}
+    assert changes[0]["timestamp"] == changes[1]["timestamp"]
+
+
+def test_operation_tracker_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        OperationTracker(_manager(tmp_path), "apply", timestamp_mode="sometimes")
+
+
+def test_rollback_dispatches_changes_by_action(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    target = tmp_path / "target"
+    target.write_text("new")
+    link = tmp_path / "link"
+    link.symlink_to(target)
+    backup = tmp_path / "target.bak"
+    backup.write_text("old")
+    repos = [tmp_path / "repo1", tmp_path / "repo2"]
+    for repo in repos:
+        (repo / ".git").mkdir(parents=True)
+
+    uninstalled = []
+
+    class FakeInstaller:
+        def uninstall(self, packages):
+            uninstalled.append(list(packages))
+            return True
+
+    monkeypatch.setattr(
+        "autorig.installers.base.get_system_installer", lambda: FakeInstaller()
+    )
+
+    rollback_file = manager.create_rollback_point(
+        "apply",
+        [
+            {"action": "installed_package", "path": "git"},
+            {"action": "created_symlink", "path": str(link)},
+            {
+                "action": "modified_file",
+                "path": str(target),
+                "previous_state": {"exists": True, "backup_path": str(backup)},
+            },
+            {"action": "git_cloned", "path": str(repos[0])},
+            {"action": "installed_package", "path": "curl"},
+            {"action": "installed_package", "path": "nope", "status": "failed"},
+            {"action": "git_cloned", "path": str(repos[1])},
+            {"action": "backup_file", "path": str(target)},
+        ],
+    )
+    manager.rollback_operation(rollback_file)
+
+    assert uninstalled == [["git", "curl"]]
+    assert not link.is_symlink()
+    assert target.read_text() == "old"
+    assert not backup.exists()
+    assert not any(repo.exists() for repo in repos)
+
+
+def test_record_change_many(tmp_path):
+    tracker = OperationTracker(_manager(tmp_path), "apply")
+
+    tracker.record_change_many("would_install_package", ["git", "vim"])
+
+    assert [(c["action"], c["path"]) for c in tracker.changes] == [
+        ("would_install_package", "git"),
+        ("would_install_package", "vim"),
+    ]
+    assert tracker.changes[0]["timestamp"] == tracker.changes[1]["timestamp"]
+
+
+def test_rollback_retries_packages_individually(tmp_path, monkeypatch):
+    manager = _manager(tmp_path)
+    uninstalled = []
+
+    class FakeInstaller:
+        def uninstall(self, packages):
+            uninstalled.append(list(packages))
+            return len(packages) == 1
+
+    monkeypatch.setattr(
+        "autorig.installers.base.get_system_installer", lambda: FakeInstaller()
+    )
+
+    rollback_file = manager.create_rollback_point(
+        "apply",
+        [
+            {"action": "installed_package", "path": "git", "status": "success"},
+            {"action": "installed_package", "path": "vim", "status": "success"},
+        ],
+    )
+    manager.rollback_operation(rollback_file)
+
+    assert uninstalled == [["git", "vim"], ["git"], ["vim"]]
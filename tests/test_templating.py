@@ -35,3 +35,29 @@ def test_render_string(tmp_path):
     # Verify
     assert "user=admin" in result
     assert "email=admin@example.com" in result
+
+
+def test_compiled_templates_are_cached(tmp_path):
+    bytecode_dir = tmp_path / "jinja"
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "greeting.j2").write_text("Hi {{ name }}")
+
+    renderer = TemplateRenderer(template_dir, cache_dir=bytecode_dir)
+    assert renderer.render_string("greeting.j2", {"name": "A"}) == "Hi A"
+    assert renderer.render_string("greeting.j2", {"name": "B"}) == "Hi B"
+
+    assert len(list(bytecode_dir.iterdir())) == 1
+    # A second renderer (a later run) reuses the stored bytecode
+    other = TemplateRenderer(template_dir, cache_dir=bytecode_dir)
+    assert other.render_string("greeting.j2", {"name": "C"}) == "Hi C"
+
+
+def test_bytecode_cache_defaults_to_autorig_cache_dir(tmp_path, isolated_home):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "greeting.j2").write_text("Hi {{ name }}")
+
+    TemplateRenderer(template_dir).render_string("greeting.j2", {"name": "A"})
+
+    assert len(list((isolated_home / ".autorig" / "cache" / "jinja").iterdir())) == 1
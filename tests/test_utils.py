@@ -0,0 +1,73 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from autorig.utils import expand_path, safe_open, validate_path
+
+
+@pytest.mark.parametrize(
+    "path", ["~/.bashrc", "/opt/tools", "/etc", "/etc/", "/usr/bin"]
+)
+def test_validate_path_accepts(path, monkeypatch):
+    monkeypatch.setenv("HOME", "/home/alice")
+    assert validate_path(path)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/etc/passwd",
+        "/usr/bin/python",
+        "/var/log/syslog",
+        "~/../etc",
+        "/./etc/passwd",
+        "/usr//bin/python",
+    ],
+)
+def test_validate_path_rejects(path):
+    assert not validate_path(path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX home and variable syntax")
+def test_expand_path_follows_environment(monkeypatch):
+    monkeypatch.setenv("HOME", "/home/alice")
+    monkeypatch.setenv("PROJECTS", "/srv/projects")
+    assert expand_path("~/.vimrc") == Path("/home/alice/.vimrc")
+    assert expand_path("$PROJECTS/app") == Path("/srv/projects/app")
+
+    monkeypatch.setenv("HOME", "/home/bob")
+    monkeypatch.setenv("PROJECTS", "/data")
+    assert expand_path("~/.vimrc") == Path("/home/bob/.vimrc")
+    assert expand_path("$PROJECTS/app") == Path("/data/app")
+
+
+@pytest.mark.skipif(os.name != "nt", reason="Windows home and variable syntax")
+def test_expand_path_follows_windows_environment(monkeypatch):
+    monkeypatch.setenv("USERPROFILE", r"C:\Users\alice")
+    monkeypatch.setenv("APPDATA", r"C:\Users\alice\AppData\Roaming")
+    assert expand_path("~/.vimrc") == Path(r"C:\Users\alice\.vimrc")
+    assert expand_path(r"%APPDATA%\foo") == Path(r"C:\Users\alice\AppData\Roaming\foo")
+
+    monkeypatch.setenv("USERPROFILE", r"C:\Users\bob")
+    assert expand_path("~/.vimrc") == Path(r"C:\Users\bob\.vimrc")
+
+
+def test_validate_path_expands_variables(monkeypatch):
+    monkeypatch.setenv("CONFIG_ROOT", "/etc")
+
+    assert not validate_path("$CONFIG_ROOT/hosts")
+
+
+def test_safe_open_expands_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / "a.txt").write_text("hello")
+
+    with safe_open("~/a.txt") as f:
+        assert f.read() == "hello"
+
+
+@pytest.mark.parametrize("path", ["/etc/passwd", "/./etc/passwd", "~/../etc"])
+def test_safe_open_rejects_unsafe_paths(path):
+    with pytest.raises(ValueError, match="Invalid path"):
+        safe_open(path)